@@ -2,6 +2,8 @@
 """Generate PNG favicons from SVG using cairosvg."""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
 
 try:
@@ -14,6 +16,13 @@ except ImportError:
     print("2. Online converter: https://cloudconvert.com/svg-to-png")
     sys.exit(1)
 
+# Optional: with Pillow the SVG is rendered once and every size is resampled
+# from that render, instead of parsing and rasterising the SVG once per size.
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
 def generate_favicon(svg_path: Path, output_path: Path, size: int):
     """Generate PNG favicon from SVG."""
     print(f"Generating {output_path.name} ({size}x{size})...")
@@ -26,8 +35,31 @@ def generate_favicon(svg_path: Path, output_path: Path, size: int):
     )
     print(f"✓ Created {output_path}")
 
+def generate_favicons_from_one_render(svg_path: Path, outputs: list[tuple[int, Path]]):
+    """Render the SVG once at twice the largest size and downsample each favicon."""
+    render_size = 2 * max(size for size, _ in outputs)
+    png = cairosvg.svg2png(
+        url=str(svg_path),
+        output_width=render_size,
+        output_height=render_size
+    )
+
+    with Image.open(BytesIO(png)) as rendered:
+        for size, output_path in outputs:
+            print(f"Generating {output_path.name} ({size}x{size})...")
+            rendered.resize((size, size), Image.Resampling.LANCZOS).save(output_path)
+            print(f"✓ Created {output_path}")
+
+def is_up_to_date(svg_path: Path, output_path: Path) -> bool:
+    """Return True if output_path exists and is no older than the SVG."""
+    return output_path.exists() and output_path.stat().st_mtime >= svg_path.stat().st_mtime
+
 def main():
-    """Generate all favicon sizes."""
+    """Generate all favicon sizes.
+
+    Favicons newer than favicon.svg are left alone; pass --force to
+    regenerate them anyway.
+    """
     img_dir = Path(__file__).parent / "static" / "img"
     svg_path = img_dir / "favicon.svg"
 
@@ -40,10 +72,31 @@ def main():
         (16, "favicon-16x16.png"),
         (32, "favicon-32x32.png"),
     ]
+    outputs = [(size, img_dir / filename) for size, filename in sizes]
+
+    force = "--force" in sys.argv[1:]
+    stale = []
+    for size, output_path in outputs:
+        if not force and is_up_to_date(svg_path, output_path):
+            print(f"✓ {output_path.name} is up to date")
+        else:
+            stale.append((size, output_path))
+
+    if not stale:
+        print("\n✓ All favicons are up to date.")
+        return
 
-    for size, filename in sizes:
-        output_path = img_dir / filename
-        generate_favicon(svg_path, output_path, size)
+    if Image is not None:
+        generate_favicons_from_one_render(svg_path, stale)
+    else:
+        # Cairo releases the GIL while rasterising, so sizes render in parallel
+        with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+            futures = [
+                executor.submit(generate_favicon, svg_path, output_path, size)
+                for size, output_path in stale
+            ]
+            for future in futures:
+                future.result()
 
     print("\n✓ All favicons generated successfully!")
     print("\nYou can now build and deploy the application.")
@@ -11,6 +11,8 @@ import sqlite3
 import sys
 from pathlib import Path
 
+from _common import open_for_migration
+
 
 def migrate(db_path: str) -> None:
     """Add post_incident_review_url column to incidents table.
@@ -18,34 +20,22 @@ def migrate(db_path: str) -> None:
     Args:
         db_path: Path to SQLite database file
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    try:
-        # Check if column already exists
-        cursor.execute("PRAGMA table_info(incidents)")
-        columns = [row[1] for row in cursor.fetchall()]
-
-        if "post_incident_review_url" in columns:
+    with open_for_migration(db_path) as cursor:
+        # Re-running is safe: SQLite refuses a duplicate column, which is
+        # cheaper to catch than listing every column first.
+        print("Adding 'post_incident_review_url' column to incidents table...")
+        try:
+            cursor.execute("""
+                ALTER TABLE incidents
+                ADD COLUMN post_incident_review_url VARCHAR(512)
+            """)
+        except sqlite3.OperationalError as e:
+            if "duplicate column name" not in str(e):
+                raise
             print("Column 'post_incident_review_url' already exists. Skipping migration.")
             return
 
-        # Add the new column
-        print("Adding 'post_incident_review_url' column to incidents table...")
-        cursor.execute("""
-            ALTER TABLE incidents
-            ADD COLUMN post_incident_review_url VARCHAR(512)
-        """)
-
-        conn.commit()
-        print("Migration completed successfully!")
-
-    except sqlite3.Error as e:
-        print(f"Error during migration: {e}")
-        conn.rollback()
-        sys.exit(1)
-    finally:
-        conn.close()
+    print("Migration completed successfully!")
 
 
 def main() -> None:
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Add a partial index over open incidents."""
+
+from _common import open_for_migration, run_migration
+
+
+def migrate(db_path: str) -> None:
+    """Create the open-incident lookup index on the incidents table.
+
+    Args:
+        db_path: Path to SQLite database file
+    """
+    with open_for_migration(db_path) as cursor:
+        # Re-running is safe: IF NOT EXISTS leaves an existing index alone.
+        print("Adding 'ix_incidents_open_lookup' index to incidents table...")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS ix_incidents_open_lookup
+            ON incidents (incident_type, host_name, service_description)
+            WHERE ended_at IS NULL
+        """)
+
+    print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    run_migration(migrate)
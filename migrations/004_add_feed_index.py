@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""Add an index for per-host and per-service feed queries."""
+
+from _common import open_for_migration, run_migration
+
+
+def migrate(db_path: str) -> None:
+    """Create the entity/started_at index on the incidents table.
+
+    Args:
+        db_path: Path to SQLite database file
+    """
+    with open_for_migration(db_path) as cursor:
+        print("Adding 'ix_incidents_entity_started' index to incidents table...")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS ix_incidents_entity_started
+            ON incidents (host_name, service_description, started_at)
+        """)
+
+    print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    run_migration(migrate)
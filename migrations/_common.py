@@ -0,0 +1,64 @@
+"""Helpers shared by the migration scripts.
+
+The scripts are run directly (``python migrations/<script>.py``), which puts
+this directory on sys.path, so they import this module as ``_common``.
+"""
+
+import sqlite3
+import sys
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def open_for_migration(db_path: str) -> Iterator[sqlite3.Cursor]:
+    """Open a database and hold its write lock for the duration of a migration.
+
+    The block's changes are committed when it exits normally. On a sqlite3
+    error they are rolled back, the error is reported and the process exits
+    with status 1.
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Yields:
+        Cursor inside an immediate (write-locked) transaction
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        # Same journal settings as the application's connections; WAL persists
+        # in the file, and these pragmas only apply outside a transaction
+        conn.executescript(
+            "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY;"
+        )
+        conn.execute("BEGIN IMMEDIATE")
+        yield conn.cursor()
+        conn.commit()
+    except sqlite3.Error as e:
+        print(f"Error during migration: {e}")
+        conn.rollback()
+        sys.exit(1)
+    finally:
+        conn.close()
+
+
+def run_migration(migrate: Callable[[str], None]) -> None:
+    """Run migrate on the database named on the command line.
+
+    Args:
+        migrate: The script's migrate(db_path) function
+    """
+    script = Path(sys.argv[0]).name
+    if len(sys.argv) != 2:
+        print(f"Usage: python {script} <path_to_database>")
+        print(f"Example: python {script} data/status.db")
+        sys.exit(1)
+
+    db_path = Path(sys.argv[1])
+
+    if not db_path.exists():
+        print(f"Error: Database file not found: {db_path}")
+        sys.exit(1)
+
+    migrate(str(db_path))
@@ -1,40 +1,55 @@
 """FastAPI routes for the status page API."""
 
+import hashlib
 import secrets
+import threading
 import time
-from collections.abc import Generator
-from datetime import UTC, datetime
+from collections import OrderedDict
+from collections.abc import Callable, Generator
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import Response
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 
+from nagios_public_status_page import config as config_module
 from nagios_public_status_page.api.graph_signing import (
     GraphRequest,
     verify_graph_signature,
 )
 from nagios_public_status_page.api.schemas import (
+    COMMENT_LIST_ADAPTER,
+    HOST_STATUS_LIST_ADAPTER,
+    INCIDENT_LIST_ADAPTER,
+    NAGIOS_COMMENT_LIST_ADAPTER,
+    SERVICE_STATUS_LIST_ADAPTER,
     CommentCreate,
     CommentResponse,
     HealthResponse,
     HostStatusResponse,
     IncidentResponse,
     IncidentWithComments,
-    NagiosCommentResponse,
     PostIncidentReviewUpdate,
     SchedulerStatusResponse,
     ServiceStatusResponse,
     StatusSummary,
 )
 from nagios_public_status_page.collector.incident_tracker import IncidentTracker
+from nagios_public_status_page.collector.poller import StatusPoller
 from nagios_public_status_page.db.database import get_session
-from nagios_public_status_page.models import Comment, Incident
+from nagios_public_status_page.models import Comment, Incident, NagiosComment
+from nagios_public_status_page.parser.status_dat import (
+    StatusDatParser,
+    load_status_dat,
+    status_dat_signature,
+)
+from nagios_public_status_page.rss.feed_generator import IncidentFeedGenerator
 
 if TYPE_CHECKING:
-    from nagios_public_status_page.collector.poller import StatusPoller
     from nagios_public_status_page.config import Config
 
 router = APIRouter(prefix="/api", tags=["api"])
@@ -42,6 +57,79 @@ rss_router = APIRouter(prefix="/feed", tags=["rss"])
 
 security = HTTPBasic()
 
+# status.dat sections the API serves from; everything else is skipped while
+# parsing
+API_SECTIONS = ("hoststatus", "servicestatus")
+
+# State names and problem states for /hosts and /services rows, shared with the
+# incident tracker so the two can never disagree.
+HOST_STATE_NAMES = IncidentTracker.STATE_NAMES["host"]
+SERVICE_STATE_NAMES = IncidentTracker.STATE_NAMES["service"]
+HOST_PROBLEM_STATES = IncidentTracker.HOST_PROBLEM_STATES
+SERVICE_PROBLEM_STATES = IncidentTracker.SERVICE_PROBLEM_STATES
+
+# How long health_check reuses a /health response
+HEALTH_CACHE_TTL_SECONDS = 1.5
+
+
+class _HealthCache:
+    """The last /health response, with when and for what it was computed.
+
+    Building happens under the lock, so concurrent probes wait for one build
+    rather than each running their own, and clear() waits for a build in
+    progress instead of being overwritten by its already-stale result.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty cache."""
+        self._lock = threading.Lock()
+        self._entry: tuple[float, tuple, HealthResponse] | None = None
+
+    def get_or_build(
+        self, key: tuple, ttl_seconds: float, build: Callable[[], HealthResponse]
+    ) -> HealthResponse:
+        """Return the cached response for key if fresh, else build and cache one.
+
+        Args:
+            key: Identifies the poller, configuration and database
+            ttl_seconds: How long a cached response stays fresh
+            build: Computes the response on a miss
+
+        Returns:
+            The health response
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._entry is not None
+                and self._entry[1] == key
+                and now - self._entry[0] < ttl_seconds
+            ):
+                return self._entry[2]
+
+            health = build()
+            self._entry = (now, key, health)
+            return health
+
+    def clear(self) -> None:
+        """Drop the cached response, so the next probe rebuilds it."""
+        with self._lock:
+            self._entry = None
+
+
+_health_cache = _HealthCache()
+
+# Serialised /hosts and /services bodies by endpoint, each with the ETag it was
+# built for. A request with no If-None-Match still skips building the rows when
+# status.dat has not changed since the last one.
+_body_cache: dict[str, tuple[str, bytes]] = {}
+
+# Rendered RSS feeds, most recently used last. See _cached_feed.
+FEED_CACHE_SIZE = 128
+FEED_CACHE_CONTROL = "public, max-age=60"
+_feed_cache_lock = threading.Lock()
+_feed_cache: OrderedDict[tuple, str | None] = OrderedDict()
+
 
 def get_config(request: Request) -> "Config":
     """Dependency returning the configuration loaded by the lifespan handler.
@@ -57,13 +145,12 @@ def get_config(request: Request) -> "Config":
     Returns:
         The application's configuration
     """
-    from nagios_public_status_page.config import load_config
-
     config = getattr(request.app.state, "config", None)
-    return config if config is not None else load_config()
+    # Looked up on the module at call time, so tests can patch load_config.
+    return config if config is not None else config_module.load_config()
 
 
-def get_poller(request: Request) -> "StatusPoller | None":
+def get_poller(request: Request) -> StatusPoller | None:
     """Dependency returning the background poller started by the lifespan handler.
 
     Returns the running instance rather than a new one. Constructing a fresh
@@ -91,6 +178,189 @@ def get_db() -> Generator[Session]:
         session.close()
 
 
+def _status_dat_version(config: "Config") -> str:
+    """Identify the current status.dat contents without reading the file.
+
+    The nagios section of the configuration is included alongside the file
+    signature because it decides which hosts and services a response contains.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        A string that changes whenever a status.dat-derived response would
+
+    Raises:
+        FileNotFoundError: If status.dat does not exist
+    """
+    signature = status_dat_signature(config.nagios.status_dat_path)
+    return f"{signature}|{config.nagios.model_dump_json()}"
+
+
+def _parsed_status_dat(config: "Config") -> StatusDatParser:
+    """Return a parser holding the current status.dat contents.
+
+    Nagios rewrites status.dat every few seconds at most, while dashboards
+    request /status, /hosts and /services far more often than that, so this
+    goes through load_status_dat's cache. The returned parser is shared
+    across requests and must be treated as read-only.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        A parsed StatusDatParser
+
+    Raises:
+        FileNotFoundError: If status.dat does not exist
+        PermissionError: If status.dat cannot be read
+    """
+    return load_status_dat(config.nagios.status_dat_path, sections=API_SECTIONS)
+
+
+def _etag(*parts: object) -> str:
+    """Build a strong ETag from the values a response is derived from.
+
+    Args:
+        *parts: Values that together determine the response body
+
+    Returns:
+        Quoted ETag header value
+    """
+    source = "|".join(str(part) for part in parts).encode("utf-8")
+    return f'"{hashlib.blake2b(source, digest_size=16).hexdigest()}"'
+
+
+def _not_modified(request: Request, etag: str) -> Response | None:
+    """Return a 304 response if the client already holds this representation.
+
+    Args:
+        request: Incoming request, checked for If-None-Match
+        etag: ETag of the representation that would otherwise be sent
+
+    Returns:
+        An empty 304 response, or None if the full response must be built
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" in candidates or etag in candidates:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
+
+
+def _incident_feed_version(db: Session, hours: int) -> tuple:
+    """Summarise everything an RSS feed over the last N hours is built from.
+
+    Incidents have no updated_at column, so the summary is an aggregate over
+    the incidents in the window: how many there are and the newest id (new
+    incidents and ones ageing out of the window), the sums of their
+    last_check and ended_at times (an active incident being re-checked, or
+    resolving), and how many user and Nagios comments they carry. One cheap
+    aggregate query replaces the full feed query plus per-entry comment loads
+    whenever nothing has changed.
+
+    Args:
+        db: Database session
+        hours: Number of hours the feed looks back
+
+    Returns:
+        A tuple that changes whenever the feed's contents would
+    """
+    cutoff = datetime.now(UTC) - timedelta(hours=hours)
+    in_window = Incident.started_at >= cutoff
+    window_ids = select(Incident.id).where(in_window)
+
+    row = db.execute(
+        select(
+            func.count(Incident.id),
+            func.max(Incident.id),
+            func.total(func.julianday(Incident.last_check)),
+            func.total(func.julianday(Incident.ended_at)),
+            select(func.count(Comment.id))
+            .where(Comment.incident_id.in_(window_ids))
+            .scalar_subquery(),
+            select(func.count(NagiosComment.id))
+            .where(NagiosComment.incident_id.in_(window_ids))
+            .scalar_subquery(),
+        ).where(in_window)
+    ).one()
+    return tuple(row)
+
+
+def _cached_feed(key: tuple, render: Callable[[], str | None]) -> str | None:
+    """Return a rendered feed, rendering it only if key has not been seen.
+
+    Feed readers and crawlers re-fetch feeds far more often than incidents
+    change, so rendered XML is kept in a small LRU. The key must include
+    everything the feed depends on -- see _incident_feed_version. A None
+    result (no incidents for the requested host or service) is cached too.
+
+    Args:
+        key: Identifies the feed and the data it was built from
+        render: Builds the feed XML on a cache miss
+
+    Returns:
+        Feed XML, or None if render() returned None
+    """
+    with _feed_cache_lock:
+        if key in _feed_cache:
+            _feed_cache.move_to_end(key)
+            return _feed_cache[key]
+
+    # Render outside the lock: feeds for different keys need not wait on each
+    # other, and two threads rendering the same key produce the same XML.
+    feed_xml = render()
+
+    with _feed_cache_lock:
+        _feed_cache[key] = feed_xml
+        _feed_cache.move_to_end(key)
+        while len(_feed_cache) > FEED_CACHE_SIZE:
+            _feed_cache.popitem(last=False)
+    return feed_xml
+
+
+def _feed_key(db: Session, config: "Config", hours: int, *feed: str) -> tuple:
+    """Build the _cached_feed key for one feed request.
+
+    Args:
+        db: Database session, whose URL distinguishes one database from another
+        config: Application configuration
+        hours: Number of hours the feed looks back
+        *feed: Which feed: ("global",), ("host", host) or ("service", host, service)
+
+    Returns:
+        Cache key, also used to derive the feed's ETag
+    """
+    return (
+        *feed,
+        hours,
+        str(db.get_bind().engine.url),
+        config.rss.model_dump_json(),
+        _incident_feed_version(db, hours),
+    )
+
+
+def _json_response(body: bytes, etag: str | None = None) -> Response:
+    """Wrap an already-serialised JSON body in a Response.
+
+    Route handlers that return a Response directly skip FastAPI's own
+    validation and serialisation of the return value against response_model,
+    so the body is encoded exactly once.
+
+    Args:
+        body: JSON-encoded response body
+        etag: ETag to send with it, if any
+
+    Returns:
+        application/json Response
+    """
+    headers = {"ETag": etag} if etag else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 def verify_write_access(
     credentials: HTTPBasicCredentials = Depends(security),
     config: "Config" = Depends(get_config),
@@ -179,11 +449,16 @@ def verify_write_access(
 )
 def health_check(
     db: Session = Depends(get_db),
-    poller: "StatusPoller | None" = Depends(get_poller),
+    poller: StatusPoller | None = Depends(get_poller),
     config: "Config" = Depends(get_config),
 ) -> HealthResponse:
     """Health check endpoint.
 
+    Orchestrators and load balancers can probe this several times a second,
+    so a response is reused for HEALTH_CACHE_TTL_SECONDS: a burst of probes
+    costs one round of database queries, and the lock makes concurrent probes
+    wait for that one rather than each running their own.
+
     Args:
         db: Database session
         poller: The running background poller, or None if it was never started
@@ -192,68 +467,85 @@ def health_check(
     Returns:
         Health status information
     """
-    from nagios_public_status_page.collector.poller import StatusPoller
-
     try:
-        # Poll metadata comes from the database, so a local instance is fine for
-        # reading it. Scheduler state is in-process and must come from the
-        # running poller, which is why the two are sourced separately below.
-        reader = poller or StatusPoller(config)
+        key = (poller, config, str(db.get_bind().engine.url))
+        return _health_cache.get_or_build(
+            key, HEALTH_CACHE_TTL_SECONDS, lambda: _build_health(db, poller, config)
+        )
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Health check failed: {exc}") from exc
 
-        # Get last poll metadata
-        last_poll = reader.get_last_poll()
-        is_stale = reader.is_data_stale()
 
-        # Get active incidents count
-        tracker = IncidentTracker(db)
-        active_count = len(tracker.get_active_incidents())
-
-        # Calculate status.dat age
-        age_seconds = None
-        if last_poll and last_poll.status_dat_mtime:
-            age_seconds = (datetime.now(UTC) - last_poll.status_dat_mtime).total_seconds()
-
-        status = "healthy"
-        if is_stale:
-            status = "stale"
-        if active_count > 0:
-            status = "degraded"
-
-        # Get scheduler status from the running poller. When the lifespan
-        # handler never ran there is no scheduler, and reporting it as stopped
-        # is the truthful answer rather than a fabricated healthy one.
-        if poller is not None:
-            scheduler_status = SchedulerStatusResponse(**poller.get_scheduler_status())
-        else:
-            scheduler_status = SchedulerStatusResponse(
-                is_running=False,
-                scheduler_running=False,
-                consecutive_failures=0,
-                max_consecutive_failures=0,
-                recovery_attempts=0,
-                last_recovery_time=None,
-                health_status="critical",
-            )
+def _build_health(
+    db: Session, poller: StatusPoller | None, config: "Config"
+) -> HealthResponse:
+    """Compute the /health response.
 
-        poll_time = last_poll.last_poll_time if last_poll else None
-        return HealthResponse(
-            status=status,
-            last_poll_time=poll_time,
-            status_dat_age_seconds=age_seconds,
-            data_is_stale=is_stale,
-            active_incidents_count=active_count,
-            database_accessible=True,
-            scheduler_status=scheduler_status,
+    Args:
+        db: Database session
+        poller: The running background poller, or None if it was never started
+        config: Application configuration
+
+    Returns:
+        Health status information
+    """
+    # Poll metadata comes from the database, so a local instance is fine for
+    # reading it. Scheduler state is in-process and must come from the
+    # running poller, which is why the two are sourced separately below.
+    reader = poller or StatusPoller(config)
+
+    # Get last poll metadata
+    last_poll = reader.get_last_poll()
+    is_stale = reader.is_data_stale()
+
+    # Get active incidents count
+    tracker = IncidentTracker(db)
+    active_count = tracker.count_active_incidents()
+
+    # Calculate status.dat age
+    age_seconds = None
+    if last_poll and last_poll.status_dat_mtime:
+        age_seconds = (datetime.now(UTC) - last_poll.status_dat_mtime).total_seconds()
+
+    status = "healthy"
+    if is_stale:
+        status = "stale"
+    if active_count > 0:
+        status = "degraded"
+
+    # Get scheduler status from the running poller. When the lifespan
+    # handler never ran there is no scheduler, and reporting it as stopped
+    # is the truthful answer rather than a fabricated healthy one.
+    if poller is not None:
+        scheduler_status = SchedulerStatusResponse(**poller.get_scheduler_status())
+    else:
+        scheduler_status = SchedulerStatusResponse(
+            is_running=False,
+            scheduler_running=False,
+            consecutive_failures=0,
+            max_consecutive_failures=0,
+            recovery_attempts=0,
+            last_recovery_time=None,
+            health_status="critical",
         )
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"Health check failed: {exc}") from exc
+
+    poll_time = last_poll.last_poll_time if last_poll else None
+    return HealthResponse(
+        status=status,
+        last_poll_time=poll_time,
+        status_dat_age_seconds=age_seconds,
+        data_is_stale=is_stale,
+        active_incidents_count=active_count,
+        database_accessible=True,
+        scheduler_status=scheduler_status,
+    )
 
 
 @router.post("/poll")
 def trigger_poll(
     db: Session = Depends(get_db),
     _auth: None = Depends(verify_write_access),
-    poller: "StatusPoller | None" = Depends(get_poller),
+    poller: StatusPoller | None = Depends(get_poller),
     config: "Config" = Depends(get_config),
 ) -> dict:
     """Manually trigger a status.dat poll.
@@ -270,11 +562,11 @@ def trigger_poll(
     Returns:
         Poll results and statistics
     """
-    from nagios_public_status_page.collector.poller import StatusPoller
-
     try:
         runner = poller or StatusPoller(config)
         results = runner.poll()
+        # Let the next health check see this poll's outcome immediately
+        _health_cache.clear()
 
         return {
             "success": True,
@@ -325,26 +617,44 @@ def trigger_poll(
     }
 )
 def get_status(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
-    poller: "StatusPoller | None" = Depends(get_poller),
+    poller: StatusPoller | None = Depends(get_poller),
     config: "Config" = Depends(get_config),
-) -> StatusSummary:
+) -> StatusSummary | Response:
     """Get overall status summary.
 
+    The database-backed fields are read first because they are cheap and also
+    feed the ETag; status.dat is only parsed when the client's copy is out of
+    date.
+
     Args:
+        request: Incoming request, checked for If-None-Match
+        response: Outgoing response, used to attach the ETag
         db: Database session
         poller: The running background poller, or None if it was never started
         config: Application configuration
 
     Returns:
-        Status summary with host/service counts
+        Status summary with host/service counts, or an empty 304 response
     """
-    from nagios_public_status_page.collector.poller import StatusPoller
-    from nagios_public_status_page.parser.status_dat import StatusDatParser
-
     try:
-        parser = StatusDatParser(config.nagios.status_dat_path)
-        parser.parse()
+        # Get active incidents
+        tracker = IncidentTracker(db)
+        active_incidents = tracker.count_active_incidents()
+
+        # Get last poll time from the running poller where available
+        reader = poller or StatusPoller(config)
+        last_poll = reader.get_last_poll()
+        is_stale = reader.is_data_stale()
+        poll_time = last_poll.last_poll_time if last_poll else None
+
+        etag = _etag(_status_dat_version(config), active_incidents, poll_time, is_stale)
+        if (not_modified := _not_modified(request, etag)) is not None:
+            return not_modified
+
+        parser = _parsed_status_dat(config)
 
         # Get hosts and services
         explicit_hosts = config.nagios.hosts if config.nagios.hosts else None
@@ -355,46 +665,28 @@ def get_status(
                 for svc in config.nagios.services
             ]
 
-        hosts = parser.get_hosts(
+        # Count host and service states while filtering, without building the
+        # filtered lists
+        host_states = parser.count_host_states(
             hostgroups=config.nagios.hostgroups if config.nagios.hostgroups else None,
             explicit_hosts=explicit_hosts,
         )
-        services = parser.get_services(
+        service_states = parser.count_service_states(
             servicegroups=config.nagios.servicegroups if config.nagios.servicegroups else None,
             explicit_services=explicit_services,
         )
 
-        # Count host states
-        hosts_up = sum(1 for h in hosts if h.get("current_state") == 0)
-        hosts_down = sum(1 for h in hosts if h.get("current_state") == 1)
-        hosts_unreachable = sum(1 for h in hosts if h.get("current_state") == 2)
-
-        # Count service states
-        services_ok = sum(1 for s in services if s.get("current_state") == 0)
-        services_warning = sum(1 for s in services if s.get("current_state") == 1)
-        services_critical = sum(1 for s in services if s.get("current_state") == 2)
-        services_unknown = sum(1 for s in services if s.get("current_state") == 3)
-
-        # Get active incidents
-        tracker = IncidentTracker(db)
-        active_incidents = len(tracker.get_active_incidents())
-
-        # Get last poll time from the running poller where available
-        reader = poller or StatusPoller(config)
-        last_poll = reader.get_last_poll()
-        is_stale = reader.is_data_stale()
-
-        poll_time = last_poll.last_poll_time if last_poll else None
+        response.headers["ETag"] = etag
         return StatusSummary(
-            total_hosts=len(hosts),
-            hosts_up=hosts_up,
-            hosts_down=hosts_down,
-            hosts_unreachable=hosts_unreachable,
-            total_services=len(services),
-            services_ok=services_ok,
-            services_warning=services_warning,
-            services_critical=services_critical,
-            services_unknown=services_unknown,
+            total_hosts=host_states.total(),
+            hosts_up=host_states[0],
+            hosts_down=host_states[1],
+            hosts_unreachable=host_states[2],
+            total_services=service_states.total(),
+            services_ok=service_states[0],
+            services_warning=service_states[1],
+            services_critical=service_states[2],
+            services_unknown=service_states[3],
             active_incidents=active_incidents,
             last_poll=poll_time,
             data_is_stale=is_stale,
@@ -405,23 +697,30 @@ def get_status(
 
 @router.get("/hosts", response_model=list[HostStatusResponse])
 def get_hosts(
+    request: Request,
     db: Session = Depends(get_db),
     config: "Config" = Depends(get_config),
-) -> list[HostStatusResponse]:
+) -> Response:
     """Get all monitored hosts with their current status.
 
     Args:
+        request: Incoming request, checked for If-None-Match
         db: Database session
         config: Application configuration
 
     Returns:
-        List of host statuses
+        JSON list of host statuses, or an empty 304 response
     """
-    from nagios_public_status_page.parser.status_dat import StatusDatParser
-
     try:
-        parser = StatusDatParser(config.nagios.status_dat_path)
-        parser.parse()
+        etag = _etag(_status_dat_version(config))
+        if (not_modified := _not_modified(request, etag)) is not None:
+            return not_modified
+
+        cached = _body_cache.get("hosts")
+        if cached is not None and cached[0] == etag:
+            return _json_response(cached[1], etag)
+
+        parser = _parsed_status_dat(config)
 
         explicit_hosts = config.nagios.hosts if config.nagios.hosts else None
         hosts = parser.get_hosts(
@@ -429,46 +728,61 @@ def get_hosts(
             explicit_hosts=explicit_hosts,
         )
 
-        state_names = {0: "UP", 1: "DOWN", 2: "UNREACHABLE"}
-
-        return [
-            HostStatusResponse(
+        # Bind the per-row lookups to locals ahead of a loop that can run over
+        # thousands of hosts. Every field is set here from parser output, so
+        # rows are built with model_construct() and serialised in one call
+        # rather than validated field by field, twice: once here and again
+        # by FastAPI against response_model.
+        state_name = HOST_STATE_NAMES.get
+        fromtimestamp = datetime.fromtimestamp
+        construct = HostStatusResponse.model_construct
+
+        rows = [
+            construct(
                 host_name=h.get("host_name", ""),
-                current_state=h.get("current_state", 0),
-                state_name=state_names.get(h.get("current_state", 0), "UNKNOWN"),
+                current_state=(state := h.get("current_state", 0)),
+                state_name=state_name(state, "UNKNOWN"),
                 plugin_output=h.get("plugin_output"),
                 last_check=(
-                    datetime.fromtimestamp(h["last_check"], UTC)
-                    if h.get("last_check")
-                    else None
+                    fromtimestamp(h["last_check"], UTC) if h.get("last_check") else None
                 ),
-                is_problem=h.get("current_state", 0) in {1, 2},
+                is_problem=state in HOST_PROBLEM_STATES,
             )
             for h in hosts
         ]
+        body = HOST_STATUS_LIST_ADAPTER.dump_json(rows)
+        _body_cache["hosts"] = (etag, body)
+        return _json_response(body, etag)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Failed to get hosts: {exc}") from exc
 
 
 @router.get("/services", response_model=list[ServiceStatusResponse])
 def get_services(
+    request: Request,
     db: Session = Depends(get_db),
     config: "Config" = Depends(get_config),
-) -> list[ServiceStatusResponse]:
+) -> Response:
     """Get all monitored services with their current status.
 
     Args:
+        request: Incoming request, checked for If-None-Match
         db: Database session
         config: Application configuration
 
     Returns:
-        List of service statuses
+        JSON list of service statuses, or an empty 304 response
     """
-    from nagios_public_status_page.parser.status_dat import StatusDatParser
-
     try:
-        parser = StatusDatParser(config.nagios.status_dat_path)
-        parser.parse()
+        etag = _etag(_status_dat_version(config))
+        if (not_modified := _not_modified(request, etag)) is not None:
+            return not_modified
+
+        cached = _body_cache.get("services")
+        if cached is not None and cached[0] == etag:
+            return _json_response(cached[1], etag)
+
+        parser = _parsed_status_dat(config)
 
         explicit_services = None
         if config.nagios.services:
@@ -482,24 +796,29 @@ def get_services(
             explicit_services=explicit_services,
         )
 
-        state_names = {0: "OK", 1: "WARNING", 2: "CRITICAL", 3: "UNKNOWN"}
+        # Bind the per-row lookups to locals ahead of a loop that can run over
+        # thousands of services. See get_hosts.
+        state_name = SERVICE_STATE_NAMES.get
+        fromtimestamp = datetime.fromtimestamp
+        construct = ServiceStatusResponse.model_construct
 
-        return [
-            ServiceStatusResponse(
+        rows = [
+            construct(
                 host_name=s.get("host_name", ""),
                 service_description=s.get("service_description", ""),
-                current_state=s.get("current_state", 0),
-                state_name=state_names.get(s.get("current_state", 0), "UNKNOWN"),
+                current_state=(state := s.get("current_state", 0)),
+                state_name=state_name(state, "UNKNOWN"),
                 plugin_output=s.get("plugin_output"),
                 last_check=(
-                    datetime.fromtimestamp(s["last_check"], UTC)
-                    if s.get("last_check")
-                    else None
+                    fromtimestamp(s["last_check"], UTC) if s.get("last_check") else None
                 ),
-                is_problem=s.get("current_state", 0) in {1, 2, 3},
+                is_problem=state in SERVICE_PROBLEM_STATES,
             )
             for s in services
         ]
+        body = SERVICE_STATUS_LIST_ADAPTER.dump_json(rows)
+        _body_cache["services"] = (etag, body)
+        return _json_response(body, etag)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Failed to get services: {exc}") from exc
 
@@ -650,7 +969,7 @@ def get_incidents(
     active_only: bool = False,
     hours: int = 24,
     db: Session = Depends(get_db),
-) -> list[IncidentResponse]:
+) -> Response:
     """Get incidents, optionally filtered.
 
     Args:
@@ -659,17 +978,19 @@ def get_incidents(
         db: Database session
 
     Returns:
-        List of incidents
+        JSON list of incidents
     """
     try:
         tracker = IncidentTracker(db)
 
         if active_only:
-            incidents = tracker.get_active_incidents()
+            rows = tracker.get_active_incident_rows()
         else:
-            incidents = tracker.get_recent_incidents(hours=hours)
+            rows = tracker.get_recent_incident_rows(hours=hours)
 
-        return [IncidentResponse.model_validate(inc) for inc in incidents]
+        return _json_response(
+            INCIDENT_LIST_ADAPTER.dump_json(INCIDENT_LIST_ADAPTER.validate_python(rows))
+        )
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Failed to get incidents: {exc}") from exc
 
@@ -689,17 +1010,28 @@ def get_incident(incident_id: int, db: Session = Depends(get_db)) -> IncidentWit
         HTTPException: If incident not found
     """
     try:
-        incident = db.query(Incident).filter(Incident.id == incident_id).first()
+        # Load both comment collections with the incident rather than lazily
+        # when they are first touched below: user comments are joined into the
+        # incident query and Nagios comments follow in a second SELECT, which
+        # avoids multiplying the two collections together in one result set.
+        incident = (
+            db.query(Incident)
+            .options(joinedload(Incident.comments), selectinload(Incident.nagios_comments))
+            .filter(Incident.id == incident_id)
+            .first()
+        )
 
         if not incident:
             raise HTTPException(status_code=404, detail="Incident not found")
 
         return IncidentWithComments(
             incident=IncidentResponse.model_validate(incident),
-            comments=[CommentResponse.model_validate(c) for c in incident.comments],
-            nagios_comments=[
-                NagiosCommentResponse.model_validate(c) for c in incident.nagios_comments
-            ],
+            comments=COMMENT_LIST_ADAPTER.validate_python(
+                incident.comments, from_attributes=True
+            ),
+            nagios_comments=NAGIOS_COMMENT_LIST_ADAPTER.validate_python(
+                incident.nagios_comments, from_attributes=True
+            ),
         )
     except HTTPException:
         raise
@@ -861,6 +1193,7 @@ def update_pir_url(
     }
 )
 def get_global_rss_feed(
+    request: Request,
     hours: int = 24,
     db: Session = Depends(get_db),
     config: "Config" = Depends(get_config),
@@ -868,20 +1201,28 @@ def get_global_rss_feed(
     """Get RSS feed for all recent incidents.
 
     Args:
+        request: Incoming request, checked for If-None-Match
         hours: Number of hours to look back (default 24)
         db: Database session
         config: Application configuration
 
     Returns:
-        RSS feed XML
+        RSS feed XML, or an empty 304 if the client's copy is current
     """
-    from nagios_public_status_page.rss.feed_generator import IncidentFeedGenerator
-
     try:
+        key = _feed_key(db, config, hours, "global")
+        etag = _etag(*key)
+        if (not_modified := _not_modified(request, etag)) is not None:
+            return not_modified
+
         generator = IncidentFeedGenerator(config.rss, base_url=config.rss.link)
-        feed_xml = generator.generate_global_feed(db, hours=hours)
+        feed_xml = _cached_feed(key, lambda: generator.generate_global_feed(db, hours=hours))
 
-        return Response(content=feed_xml, media_type="application/rss+xml")
+        return Response(
+            content=feed_xml,
+            media_type="application/rss+xml",
+            headers={"ETag": etag, "Cache-Control": FEED_CACHE_CONTROL},
+        )
     except Exception as exc:
         raise HTTPException(
             status_code=500, detail=f"Failed to generate RSS feed: {exc}"
@@ -890,6 +1231,7 @@ def get_global_rss_feed(
 
 @rss_router.get("/host/{host_name}/rss.xml")
 def get_host_rss_feed(
+    request: Request,
     host_name: str,
     hours: int = 24,
     db: Session = Depends(get_db),
@@ -898,29 +1240,39 @@ def get_host_rss_feed(
     """Get RSS feed for a specific host's incidents.
 
     Args:
+        request: Incoming request, checked for If-None-Match
         host_name: Host name to filter by
         hours: Number of hours to look back (default 24)
         db: Database session
         config: Application configuration
 
     Returns:
-        RSS feed XML
+        RSS feed XML, or an empty 304 if the client's copy is current
 
     Raises:
         HTTPException: If host has no incidents
     """
-    from nagios_public_status_page.rss.feed_generator import IncidentFeedGenerator
-
     try:
+        key = _feed_key(db, config, hours, "host", host_name)
+        etag = _etag(*key)
+        if (not_modified := _not_modified(request, etag)) is not None:
+            return not_modified
+
         generator = IncidentFeedGenerator(config.rss, base_url=config.rss.link)
-        feed_xml = generator.generate_host_feed(db, host_name, hours=hours)
+        feed_xml = _cached_feed(
+            key, lambda: generator.generate_host_feed(db, host_name, hours=hours)
+        )
 
         if feed_xml is None:
             raise HTTPException(
                 status_code=404, detail=f"No incidents found for host: {host_name}"
             )
 
-        return Response(content=feed_xml, media_type="application/rss+xml")
+        return Response(
+            content=feed_xml,
+            media_type="application/rss+xml",
+            headers={"ETag": etag, "Cache-Control": FEED_CACHE_CONTROL},
+        )
     except HTTPException:
         raise
     except Exception as exc:
@@ -931,6 +1283,7 @@ def get_host_rss_feed(
 
 @rss_router.get("/service/{host_name}/{service_description:path}/rss.xml")
 def get_service_rss_feed(
+    request: Request,
     host_name: str,
     service_description: str,
     hours: int = 24,
@@ -940,6 +1293,7 @@ def get_service_rss_feed(
     """Get RSS feed for a specific service's incidents.
 
     Args:
+        request: Incoming request, checked for If-None-Match
         host_name: Host name
         service_description: Service description (may contain / or other special characters;
             pass raw or percent-encoded, e.g. "Disk Space, /var" or "Disk%20Space%2C%20%2Fvar")
@@ -948,17 +1302,23 @@ def get_service_rss_feed(
         config: Application configuration
 
     Returns:
-        RSS feed XML
+        RSS feed XML, or an empty 304 if the client's copy is current
 
     Raises:
         HTTPException: If service has no incidents
     """
-    from nagios_public_status_page.rss.feed_generator import IncidentFeedGenerator
-
     try:
+        key = _feed_key(db, config, hours, "service", host_name, service_description)
+        etag = _etag(*key)
+        if (not_modified := _not_modified(request, etag)) is not None:
+            return not_modified
+
         generator = IncidentFeedGenerator(config.rss, base_url=config.rss.link)
-        feed_xml = generator.generate_service_feed(
-            db, host_name, service_description, hours=hours
+        feed_xml = _cached_feed(
+            key,
+            lambda: generator.generate_service_feed(
+                db, host_name, service_description, hours=hours
+            ),
         )
 
         if feed_xml is None:
@@ -967,7 +1327,11 @@ def get_service_rss_feed(
                 detail=f"No incidents found for service: {host_name}/{service_description}",
             )
 
-        return Response(content=feed_xml, media_type="application/rss+xml")
+        return Response(
+            content=feed_xml,
+            media_type="application/rss+xml",
+            headers={"ETag": etag, "Cache-Control": FEED_CACHE_CONTROL},
+        )
     except HTTPException:
         raise
     except Exception as exc:
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Annotated
 
-from pydantic import BaseModel, ConfigDict, Field, PlainSerializer
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, TypeAdapter
 
 # Timestamps are timezone-aware UTC internally but serialise without an offset,
 # preserving the established API contract: clients receive naive strings and
@@ -137,6 +137,8 @@ class PostIncidentReviewUpdate(BaseModel):
 class NagiosCommentResponse(BaseModel):
     """Schema for Nagios comment response."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     incident_id: int | None
     entry_time: UTCTimestamp
@@ -145,11 +147,6 @@ class NagiosCommentResponse(BaseModel):
     host_name: str
     service_description: str | None
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
-
 
 class HostStatusResponse(BaseModel):
     """Schema for host status response."""
@@ -307,16 +304,13 @@ class HealthResponse(BaseModel):
 class PollMetadataResponse(BaseModel):
     """Schema for poll metadata response."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     last_poll_time: UTCTimestamp
     status_dat_mtime: UTCTimestamp
     records_processed: int | None
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
-
 
 class IncidentWithComments(BaseModel):
     """Schema for incident with all comments."""
@@ -324,3 +318,13 @@ class IncidentWithComments(BaseModel):
     incident: IncidentResponse
     comments: list[CommentResponse]
     nagios_comments: list[NagiosCommentResponse]
+
+
+# Adapters for validating or serialising whole result lists in one call rather
+# than one model call per row. Built once at import so the schema is compiled
+# once.
+INCIDENT_LIST_ADAPTER = TypeAdapter(list[IncidentResponse])
+COMMENT_LIST_ADAPTER = TypeAdapter(list[CommentResponse])
+NAGIOS_COMMENT_LIST_ADAPTER = TypeAdapter(list[NagiosCommentResponse])
+HOST_STATUS_LIST_ADAPTER = TypeAdapter(list[HostStatusResponse])
+SERVICE_STATUS_LIST_ADAPTER = TypeAdapter(list[ServiceStatusResponse])
@@ -1,32 +1,100 @@
 """Incident tracking and management service."""
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
-from typing import Any, ClassVar
+from typing import Any, ClassVar, cast
 
+from sqlalchemy import ColumnElement, CursorResult, RowMapping, delete, func, select
 from sqlalchemy.orm import Session
 
-from nagios_public_status_page.models import Incident, NagiosComment
+from nagios_public_status_page.models import Comment, Incident, NagiosComment
 
 
 class IncidentTracker:
     """Track and manage host and service incidents."""
 
     # State mappings for hosts and services
-    HOST_PROBLEM_STATES: ClassVar[set[int]] = {1, 2}  # DOWN, UNREACHABLE
-    SERVICE_PROBLEM_STATES: ClassVar[set[int]] = {1, 2, 3}  # WARNING, CRITICAL, UNKNOWN
+    HOST_PROBLEM_STATES: ClassVar[frozenset[int]] = frozenset({1, 2})  # DOWN, UNREACHABLE
+    # WARNING, CRITICAL, UNKNOWN
+    SERVICE_PROBLEM_STATES: ClassVar[frozenset[int]] = frozenset({1, 2, 3})
+
+    PROBLEM_STATES: ClassVar[dict[str, frozenset[int]]] = {
+        "host": HOST_PROBLEM_STATES,
+        "service": SERVICE_PROBLEM_STATES,
+    }
 
     STATE_NAMES: ClassVar[dict[str, dict[int, str]]] = {
         "host": {0: "UP", 1: "DOWN", 2: "UNREACHABLE"},
         "service": {0: "OK", 1: "WARNING", 2: "CRITICAL", 3: "UNKNOWN"},
     }
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, autocommit: bool = True):
         """Initialize incident tracker.
 
         Args:
             session: SQLAlchemy database session
+            autocommit: Commit after every change. When False the caller commits,
+                so a whole poll's inserts and updates are flushed together.
         """
         self.session = session
+        self.autocommit = autocommit
+        self._open_incidents: dict[tuple[str, str, str | None], Incident] | None = None
+
+    def preload_open_incidents(self) -> None:
+        """Load every open incident so later lookups skip the database.
+
+        Once loaded, find_open_incident() answers from memory, and incidents this
+        tracker opens or closes keep the map current. Meant for a poll that checks
+        every host and service in turn.
+        """
+        self._open_incidents = {
+            (incident.incident_type, incident.host_name, incident.service_description): incident
+            for incident in self.session.scalars(
+                select(Incident).where(Incident.ended_at.is_(None))
+            )
+        }
+
+    def find_open_incident(
+        self, incident_type: str, host_name: str, service_description: str | None = None
+    ) -> Incident | None:
+        """Find the active incident for a host or service.
+
+        Args:
+            incident_type: 'host' or 'service'
+            host_name: Host name
+            service_description: Service description, for service incidents
+
+        Returns:
+            The open Incident, or None if there is none
+        """
+        if self._open_incidents is not None:
+            return self._open_incidents.get((incident_type, host_name, service_description))
+
+        query = self.session.query(Incident).filter(
+            Incident.incident_type == incident_type,
+            Incident.host_name == host_name,
+            Incident.ended_at.is_(None),
+        )
+        if service_description is not None:
+            query = query.filter(Incident.service_description == service_description)
+        return query.first()
+
+    def _track_opened(self, incident: Incident) -> None:
+        """Record a newly opened incident in the preloaded map, if any."""
+        if self._open_incidents is not None:
+            key = (incident.incident_type, incident.host_name, incident.service_description)
+            self._open_incidents[key] = incident
+
+    def _track_closed(self, incident: Incident) -> None:
+        """Drop a closed incident from the preloaded map, if any."""
+        if self._open_incidents is not None:
+            key = (incident.incident_type, incident.host_name, incident.service_description)
+            self._open_incidents.pop(key, None)
+
+    def _commit(self) -> None:
+        """Commit the session, unless the caller has taken over committing."""
+        if self.autocommit:
+            self.session.commit()
 
     def _get_state_name(self, incident_type: str, state_code: int) -> str:
         """Convert state code to human-readable name.
@@ -50,15 +118,17 @@ class IncidentTracker:
         Returns:
             True if state is a problem state
         """
-        if incident_type == "host":
-            return state_code in self.HOST_PROBLEM_STATES
-        return state_code in self.SERVICE_PROBLEM_STATES
+        return state_code in self.PROBLEM_STATES.get(incident_type, self.SERVICE_PROBLEM_STATES)
 
-    def process_host(self, host_data: dict[str, Any]) -> Incident | None:
+    def process_host(
+        self, host_data: dict[str, Any], now: datetime | None = None
+    ) -> Incident | None:
         """Process a host status and update incident tracking.
 
         Args:
             host_data: Host status dictionary from parser
+            now: Time to record when the status has no last_check. Defaults to
+                the current time; a poll passes its own so timestamps agree.
 
         Returns:
             Incident object if one was created/updated, None otherwise
@@ -73,18 +143,12 @@ class IncidentTracker:
             return None
 
         # Convert timestamp to datetime
-        check_time = datetime.fromtimestamp(last_check, UTC) if last_check else datetime.now(UTC)
+        if now is None:
+            now = datetime.now(UTC)
+        check_time = datetime.fromtimestamp(last_check, UTC) if last_check else now
 
         # Check for existing active incident
-        existing = (
-            self.session.query(Incident)
-            .filter(
-                Incident.incident_type == "host",
-                Incident.host_name == host_name,
-                Incident.ended_at.is_(None),
-            )
-            .first()
-        )
+        existing = self.find_open_incident("host", host_name)
 
         is_problem = self._is_problem_state("host", current_state)
         state_name = self._get_state_name("host", current_state)
@@ -96,7 +160,7 @@ class IncidentTracker:
                 existing.last_check = check_time
                 existing.plugin_output = plugin_output
                 existing.acknowledged = acknowledged
-                self.session.commit()
+                self._commit()
                 return existing
 
             # Create new incident
@@ -111,22 +175,28 @@ class IncidentTracker:
                 acknowledged=acknowledged,
             )
             self.session.add(incident)
-            self.session.commit()
+            self._commit()
+            self._track_opened(incident)
             return incident
 
         # Not a problem - close existing incident if any
         if existing:
             existing.ended_at = check_time
-            self.session.commit()
+            self._commit()
+            self._track_closed(existing)
             return existing
 
         return None
 
-    def process_service(self, service_data: dict[str, Any]) -> Incident | None:
+    def process_service(
+        self, service_data: dict[str, Any], now: datetime | None = None
+    ) -> Incident | None:
         """Process a service status and update incident tracking.
 
         Args:
             service_data: Service status dictionary from parser
+            now: Time to record when the status has no last_check. Defaults to
+                the current time; a poll passes its own so timestamps agree.
 
         Returns:
             Incident object if one was created/updated, None otherwise
@@ -142,19 +212,12 @@ class IncidentTracker:
             return None
 
         # Convert timestamp to datetime
-        check_time = datetime.fromtimestamp(last_check, UTC) if last_check else datetime.now(UTC)
+        if now is None:
+            now = datetime.now(UTC)
+        check_time = datetime.fromtimestamp(last_check, UTC) if last_check else now
 
         # Check for existing active incident
-        existing = (
-            self.session.query(Incident)
-            .filter(
-                Incident.incident_type == "service",
-                Incident.host_name == host_name,
-                Incident.service_description == service_description,
-                Incident.ended_at.is_(None),
-            )
-            .first()
-        )
+        existing = self.find_open_incident("service", host_name, service_description)
 
         is_problem = self._is_problem_state("service", current_state)
         state_name = self._get_state_name("service", current_state)
@@ -166,7 +229,7 @@ class IncidentTracker:
                 existing.last_check = check_time
                 existing.plugin_output = plugin_output
                 existing.acknowledged = acknowledged
-                self.session.commit()
+                self._commit()
                 return existing
 
             # Create new incident
@@ -181,13 +244,15 @@ class IncidentTracker:
                 acknowledged=acknowledged,
             )
             self.session.add(incident)
-            self.session.commit()
+            self._commit()
+            self._track_opened(incident)
             return incident
 
         # Not a problem - close existing incident if any
         if existing:
             existing.ended_at = check_time
-            self.session.commit()
+            self._commit()
+            self._track_closed(existing)
             return existing
 
         return None
@@ -240,7 +305,7 @@ class IncidentTracker:
             service_description=service_description,
         )
         self.session.add(nagios_comment)
-        self.session.commit()
+        self._commit()
         return nagios_comment
 
     def link_comment_to_incident(
@@ -257,7 +322,7 @@ class IncidentTracker:
             incident.ended_at is None or comment.entry_time <= incident.ended_at
         ):
             comment.incident_id = incident.id
-            self.session.commit()
+            self._commit()
 
     def get_active_incidents(self) -> list[Incident]:
         """Get all active (unresolved) incidents.
@@ -272,6 +337,63 @@ class IncidentTracker:
             .all()
         )
 
+    def count_active_incidents(self) -> int:
+        """Count active (unresolved) incidents without loading them.
+
+        Returns:
+            Number of active incidents
+        """
+        return self.session.execute(
+            select(func.count()).select_from(Incident).where(Incident.ended_at.is_(None))
+        ).scalar_one()
+
+    def get_active_incident_rows(self) -> Sequence[RowMapping]:
+        """Get all active incidents as plain rows, for read-only listing.
+
+        Returns:
+            Mappings with every Incident column plus is_active, newest first
+        """
+        return self._incident_rows(Incident.ended_at.is_(None))
+
+    def get_recent_incident_rows(self, hours: int = 24) -> Sequence[RowMapping]:
+        """Get incidents from the last N hours as plain rows, for read-only listing.
+
+        Args:
+            hours: Number of hours to look back
+
+        Returns:
+            Mappings with every Incident column plus is_active, newest first
+        """
+        cutoff = datetime.now(UTC).timestamp() - (hours * 3600)
+        cutoff_datetime = datetime.fromtimestamp(cutoff, UTC)
+
+        return self._incident_rows(Incident.started_at >= cutoff_datetime)
+
+    def _incident_rows(self, criterion: ColumnElement[bool]) -> Sequence[RowMapping]:
+        """Select incident columns directly, without building ORM objects.
+
+        Listings only read the incidents, so skipping identity-map tracking and
+        attribute instrumentation per row is free.
+
+        Args:
+            criterion: WHERE clause selecting the incidents
+
+        Returns:
+            Mappings with every Incident column plus is_active, newest first
+        """
+        return (
+            self.session.execute(
+                select(
+                    *Incident.__table__.columns,
+                    Incident.ended_at.is_(None).label("is_active"),
+                )
+                .where(criterion)
+                .order_by(Incident.started_at.desc())
+            )
+            .mappings()
+            .all()
+        )
+
     def get_recent_incidents(self, hours: int = 24) -> list[Incident]:
         """Get incidents from the last N hours.
 
@@ -303,13 +425,21 @@ class IncidentTracker:
         cutoff = datetime.now(UTC).timestamp() - (days * 86400)
         cutoff_datetime = datetime.fromtimestamp(cutoff, UTC)
 
-        deleted = (
-            self.session.query(Incident)
-            .filter(
-                Incident.ended_at.isnot(None), Incident.ended_at < cutoff_datetime
-            )
-            .delete()
+        old_incident_ids = select(Incident.id).where(
+            Incident.ended_at.isnot(None), Incident.ended_at < cutoff_datetime
+        )
+
+        # Set-based DELETEs skip the ORM's delete-orphan cascade, so remove the
+        # incidents' comments first, as deleting each Incident would have.
+        self.session.execute(delete(Comment).where(Comment.incident_id.in_(old_incident_ids)))
+        self.session.execute(
+            delete(NagiosComment).where(NagiosComment.incident_id.in_(old_incident_ids))
+        )
+        # DML statements return a CursorResult, which carries the rowcount
+        result = cast(
+            CursorResult,
+            self.session.execute(delete(Incident).where(Incident.id.in_(old_incident_ids))),
         )
 
-        self.session.commit()
-        return deleted
+        self._commit()
+        return result.rowcount
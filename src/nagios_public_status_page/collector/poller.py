@@ -5,19 +5,31 @@ import threading
 from datetime import UTC, datetime
 from typing import Any, TypedDict
 
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from sqlalchemy.orm import Session
 
 from nagios_public_status_page.collector.incident_tracker import IncidentTracker
 from nagios_public_status_page.config import Config
 from nagios_public_status_page.db.database import get_database
-from nagios_public_status_page.models import Incident, PollMetadata
-from nagios_public_status_page.parser.status_dat import StatusDatParser
+from nagios_public_status_page.models import PollMetadata
+from nagios_public_status_page.parser.status_dat import (
+    StatusDatParser,
+    status_dat_signature,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# status.dat sections a poll reads; contact status, downtime and the like are
+# skipped while parsing
+POLL_SECTIONS = ("hoststatus", "servicestatus", "hostcomment", "servicecomment")
+
+# Hour of day (scheduler local time) at which closed incidents past their
+# retention period are deleted
+CLEANUP_HOUR = 3
+
 
 class PollResults(TypedDict):
     """Type definition for poll results dictionary."""
@@ -42,8 +54,8 @@ class StatusPoller:
             config: Application configuration
         """
         self.config = config
-        self.parser = StatusDatParser(config.nagios.status_dat_path)
-        self.scheduler = BackgroundScheduler()
+        self.parser = StatusDatParser(config.nagios.status_dat_path, sections=POLL_SECTIONS)
+        self.scheduler = self._create_scheduler()
         self.is_running = False
 
         # Self-healing configuration with thread safety
@@ -53,9 +65,31 @@ class StatusPoller:
         self._recovery_attempts = 0
         self._last_recovery_time: datetime | None = None
 
+        # Identity of the status.dat last polled successfully, so an unchanged
+        # file can skip re-processing every host and service
+        self._last_status_dat_signature: tuple[int, int, int] | None = None
+        self._last_records_processed = 0
+
+        # Metadata of the latest poll, so staleness checks from request threads
+        # need not query the database. Written by the polling thread.
+        self._last_poll_lock = threading.Lock()
+        self._last_poll: PollMetadata | None = None
+
         # Initialize database
         self.db = get_database(config.database.path)
 
+    @staticmethod
+    def _create_scheduler() -> BackgroundScheduler:
+        """Create the scheduler that runs polls.
+
+        The only job is the poll, which never overlaps itself, so one worker
+        thread replaces APScheduler's default pool of ten.
+
+        Returns:
+            An unstarted BackgroundScheduler
+        """
+        return BackgroundScheduler(executors={"default": ThreadPoolExecutor(max_workers=1)})
+
     def _get_session(self) -> Session:
         """Get a new database session.
 
@@ -188,7 +222,7 @@ class StatusPoller:
             self.is_running = False
 
             # Create a new scheduler instance
-            self.scheduler = BackgroundScheduler()
+            self.scheduler = self._create_scheduler()
             logger.info("Created new scheduler instance")
 
             # Reset failure counter
@@ -214,8 +248,10 @@ class StatusPoller:
         """
         logger.info("Starting status.dat poll")
         session = self._get_session()
+        # One timestamp for the whole poll, shared with the tracker
+        now = datetime.now(UTC)
         results: PollResults = {
-            "timestamp": datetime.now(UTC),
+            "timestamp": now,
             "hosts_processed": 0,
             "services_processed": 0,
             "incidents_created": 0,
@@ -226,6 +262,13 @@ class StatusPoller:
         }
 
         try:
+            signature = self._status_dat_signature()
+            if signature is not None and signature == self._last_status_dat_signature:
+                logger.info("status.dat unchanged since last poll, skipping processing")
+                self._check_staleness(results)
+                self._record_poll(session, self._last_records_processed, now)
+                return results
+
             # Parse status.dat
             try:
                 self.parser.parse()
@@ -240,33 +283,33 @@ class StatusPoller:
                 results["errors"].append(error_msg)
                 return results
 
-            # Check for stale data
-            if self.parser.is_data_stale(self.config.polling.staleness_threshold_seconds):
-                age = self.parser.get_data_age_seconds()
-                warning_msg = f"status.dat data is stale ({age:.0f} seconds old)"
-                logger.warning(warning_msg)
-                results["errors"].append(warning_msg)
+            self._check_staleness(results)
 
-            # Initialize incident tracker
-            tracker = IncidentTracker(session)
+            # Initialize incident tracker. The poll commits once, at the end, so
+            # every new and changed incident is written in a single flush.
+            tracker = IncidentTracker(session, autocommit=False)
+            tracker.preload_open_incidents()
 
             # Process hosts
             explicit_hosts = self.config.nagios.hosts if self.config.nagios.hosts else None
-            hosts = self.parser.get_hosts(
+            hosts = self.parser.iter_hosts(
                 hostgroups=self.config.nagios.hostgroups if self.config.nagios.hostgroups else None,
                 explicit_hosts=explicit_hosts,
             )
+            # Tally in locals and store once, rather than updating the results
+            # dict on every iteration
+            hosts_processed = services_processed = 0
+            created = updated = closed = 0
             for host in hosts:
-                incident = tracker.process_host(host)
-                results["hosts_processed"] += 1
-
+                hosts_processed += 1
+                incident = tracker.process_host(host, now)
                 if incident:
                     if incident.ended_at:
-                        results["incidents_closed"] += 1
-                    elif incident.id and incident.started_at < datetime.now(UTC):
-                        results["incidents_updated"] += 1
+                        closed += 1
+                    elif incident.id and incident.started_at < now:
+                        updated += 1
                     else:
-                        results["incidents_created"] += 1
+                        created += 1
 
             # Process services
             explicit_services = None
@@ -280,73 +323,56 @@ class StatusPoller:
                 if self.config.nagios.servicegroups
                 else None
             )
-            services = self.parser.get_services(
+            services = self.parser.iter_services(
                 servicegroups=servicegroups_param,
                 explicit_services=explicit_services,
             )
             for service in services:
-                incident = tracker.process_service(service)
-                results["services_processed"] += 1
-
+                services_processed += 1
+                incident = tracker.process_service(service, now)
                 if incident:
                     if incident.ended_at:
-                        results["incidents_closed"] += 1
-                    elif incident.id and incident.started_at < datetime.now(UTC):
-                        results["incidents_updated"] += 1
+                        closed += 1
+                    elif incident.id and incident.started_at < now:
+                        updated += 1
                     else:
-                        results["incidents_created"] += 1
+                        created += 1
+
+            results["hosts_processed"] = hosts_processed
+            results["services_processed"] = services_processed
+            results["incidents_created"] = created
+            results["incidents_updated"] = updated
+            results["incidents_closed"] = closed
 
             # Process Nagios comments if enabled
             if self.config.comments.pull_nagios_comments:
+                # Flush first so new incidents have ids for comments to link to
+                session.flush()
                 comments = self.parser.get_comments()
                 for comment_data in comments:
                     host_name = comment_data.get("host_name")
                     service_description = comment_data.get("service_description")
+                    # process_nagios_comment would reject it anyway
+                    if not host_name:
+                        continue
 
                     # Try to find matching incident
-                    incident = None
                     if service_description:
-                        # Service comment
-                        incident = (
-                            session.query(Incident)
-                            .filter(
-                                Incident.incident_type == "service",
-                                Incident.host_name == host_name,
-                                Incident.service_description == service_description,
-                                Incident.ended_at.is_(None),
-                            )
-                            .first()
+                        incident = tracker.find_open_incident(
+                            "service", host_name, service_description
                         )
                     else:
-                        # Host comment
-                        incident = (
-                            session.query(Incident)
-                            .filter(
-                                Incident.incident_type == "host",
-                                Incident.host_name == host_name,
-                                Incident.ended_at.is_(None),
-                            )
-                            .first()
-                        )
+                        incident = tracker.find_open_incident("host", host_name)
 
                     nagios_comment = tracker.process_nagios_comment(comment_data, incident)
                     if nagios_comment:
                         results["comments_processed"] += 1
 
-            # Record poll metadata
-            metadata = PollMetadata(
-                last_poll_time=datetime.now(UTC),
-                status_dat_mtime=self.parser.file_mtime or datetime.now(UTC),
-                records_processed=results["hosts_processed"] + results["services_processed"],
-            )
-            session.add(metadata)
-            session.commit()
-
-            # Cleanup old incidents if configured
-            if self.config.incidents.retention_days > 0:
-                deleted = tracker.cleanup_old_incidents(self.config.incidents.retention_days)
-                if deleted > 0:
-                    logger.info("Cleaned up %d old incidents", deleted)
+            # Record poll metadata and commit the whole poll
+            records_processed = results["hosts_processed"] + results["services_processed"]
+            self._record_poll(session, records_processed, now)
+            self._last_status_dat_signature = signature
+            self._last_records_processed = records_processed
 
             logger.info(
                 "Poll complete: %d hosts, %d services, %d incidents created, %d updated, %d closed",
@@ -367,6 +393,69 @@ class StatusPoller:
 
         return results
 
+    def _status_dat_signature(self) -> tuple[int, int, int] | None:
+        """Identify the current status.dat by inode, mtime and size.
+
+        Nagios replaces status.dat by renaming a new file over it, so any update
+        changes at least one of these.
+
+        Returns:
+            (inode, mtime in ns, size), or None if the file cannot be stat'ed
+        """
+        try:
+            return status_dat_signature(self.config.nagios.status_dat_path)
+        except OSError:
+            return None
+
+    def _check_staleness(self, results: PollResults) -> None:
+        """Add a warning to the poll results if the parsed data is stale.
+
+        Args:
+            results: Poll results to record the warning in
+        """
+        if self.parser.is_data_stale(self.config.polling.staleness_threshold_seconds):
+            age = self.parser.get_data_age_seconds()
+            warning_msg = f"status.dat data is stale ({age:.0f} seconds old)"
+            logger.warning(warning_msg)
+            results["errors"].append(warning_msg)
+
+    def _record_poll(self, session: Session, records_processed: int, now: datetime) -> None:
+        """Record poll metadata and commit the session.
+
+        Args:
+            session: Session holding the poll's changes
+            records_processed: Hosts plus services covered by the poll
+            now: Time the poll started
+        """
+        metadata = PollMetadata(
+            last_poll_time=now,
+            status_dat_mtime=self.parser.file_mtime or now,
+            records_processed=records_processed,
+        )
+        session.add(metadata)
+        session.commit()
+
+        with self._last_poll_lock:
+            self._last_poll = metadata
+
+    def _cleanup(self) -> None:
+        """Delete closed incidents older than the configured retention period.
+
+        Runs as its own daily job rather than on every poll; retention is
+        measured in days, so once a day is enough.
+        """
+        session = self._get_session()
+        try:
+            deleted = IncidentTracker(session).cleanup_old_incidents(
+                self.config.incidents.retention_days
+            )
+            if deleted > 0:
+                logger.info("Cleaned up %d old incidents", deleted)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Error cleaning up old incidents")
+        finally:
+            session.close()
+
     def start(self) -> None:
         """Start the background polling scheduler."""
         if self.is_running:
@@ -385,8 +474,32 @@ class StatusPoller:
             id="status_poll",
             replace_existing=True,
             max_instances=1,  # Prevent overlapping polls
+            # Runs missed while a slow poll held the worker collapse into one,
+            # and are still taken up to an interval late rather than dropped
+            coalesce=True,
+            misfire_grace_time=self.config.polling.interval_seconds,
         )
 
+        # Cleanup old incidents if configured: once now, then daily. Both runs
+        # are jobs on the single worker thread, so they never overlap a
+        # scheduled poll and startup does not wait on the deletes.
+        if self.config.incidents.retention_days > 0:
+            self.scheduler.add_job(
+                self._cleanup,
+                id="incident_cleanup_startup",
+                replace_existing=True,
+                misfire_grace_time=None,  # Run once however late the worker gets to it
+            )
+            self.scheduler.add_job(
+                self._cleanup,
+                "cron",
+                hour=CLEANUP_HOUR,
+                id="incident_cleanup",
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True,
+            )
+
         self.scheduler.start()
         self.is_running = True
         logger.info(
@@ -407,12 +520,19 @@ class StatusPoller:
     def get_last_poll(self) -> PollMetadata | None:
         """Get metadata from the last poll.
 
+        Served from memory once this poller has polled or read it; the database
+        is only queried on a cold start, e.g. for polls from a previous run.
+
         Returns:
             PollMetadata object or None if no polls have run
         """
+        with self._last_poll_lock:
+            if self._last_poll is not None:
+                return self._last_poll
+
         session = self._get_session()
         try:
-            return (
+            last_poll = (
                 session.query(PollMetadata)
                 .order_by(PollMetadata.last_poll_time.desc())
                 .first()
@@ -420,6 +540,14 @@ class StatusPoller:
         finally:
             session.close()
 
+        if last_poll is not None:
+            with self._last_poll_lock:
+                # A poll that committed meanwhile is newer than the row read
+                if self._last_poll is None:
+                    self._last_poll = last_poll
+                last_poll = self._last_poll
+        return last_poll
+
     def is_data_stale(self) -> bool:
         """Check if the current data is stale.
 
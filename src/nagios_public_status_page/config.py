@@ -65,6 +65,12 @@ class APIConfig(BaseModel):
     basic_auth_password: str | None = Field(
         default=None, description="Password for Basic Auth (write operations only)"
     )
+    worker_threads: int = Field(
+        default=40,
+        ge=1,
+        description="Threads available to run request handlers (status.dat parsing, "
+        "database queries, RSS generation) concurrently",
+    )
 
 
 class GraphConfig(BaseModel):
@@ -202,6 +208,9 @@ def load_config(config_path: str | Path = "config.yaml") -> Config:
     if api_port := os.getenv("API_PORT"):
         config_data.setdefault("api", {})["port"] = int(api_port)
 
+    if worker_threads := os.getenv("API_WORKER_THREADS"):
+        config_data.setdefault("api", {})["worker_threads"] = int(worker_threads)
+
     if auth_username := os.getenv("API_BASIC_AUTH_USERNAME"):
         config_data.setdefault("api", {})["basic_auth_username"] = auth_username
 
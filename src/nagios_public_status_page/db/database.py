@@ -2,11 +2,35 @@
 
 from pathlib import Path
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from nagios_public_status_page.models import Base
 
+# Connections kept open, and extra connections allowed under burst load. Their
+# sum matches the default size of the threadpool sync route handlers run in.
+POOL_SIZE = 20
+POOL_MAX_OVERFLOW = 20
+
+# Applied to every new connection. WAL lets API reads proceed while the poller
+# writes, and synchronous=NORMAL is durable in WAL mode while only syncing at
+# checkpoints rather than on every commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """Configure a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class Database:
     """Database manager for SQLite."""
@@ -26,13 +50,20 @@ class Database:
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create engine
+        # Create engine. Sync route handlers run in FastAPI's threadpool (40
+        # workers by default) alongside the poller, so size the connection pool
+        # to match rather than leave requests queueing on the default of 5+10.
+        # StaticPool/SingletonThreadPool are not used: the former shares one
+        # connection across threads and the latter pins one to every thread.
         database_url = f"sqlite:///{self.db_path}"
         self.engine = create_engine(
             database_url,
             echo=False,
             connect_args={"check_same_thread": False},  # Needed for SQLite with FastAPI
+            pool_size=POOL_SIZE,
+            max_overflow=POOL_MAX_OVERFLOW,
         )
+        event.listen(self.engine, "connect", _set_sqlite_pragmas)
 
         # Create tables
         Base.metadata.create_all(self.engine)
@@ -4,9 +4,10 @@ import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from nagios_public_status_page.api.routes import router, rss_router
@@ -46,9 +47,18 @@ async def lifespan(app: FastAPI):
     (#67). Caching means an edit to config.yaml or .env now requires a
     container restart to take effect; that trade is accepted and documented in
     DEPLOYMENT.md.
+
+    Route handlers are plain ``def`` functions because the work they do --
+    parsing status.dat, SQLAlchemy queries, building RSS -- is blocking, so
+    FastAPI runs them on anyio's worker threads. That pool is sized from
+    ``api.worker_threads`` here, before any request is served.
     """
     logger.info("Starting application...")
 
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        config.api.worker_threads
+    )
+
     try:
         # Publish the configuration loaded at import time, and start the
         # background poller against that same object.
@@ -148,22 +158,23 @@ if static_dir.exists():
     app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
 
-@app.get("/", response_model=None)
-async def root() -> FileResponse | JSONResponse:
-    """Serve the main dashboard page.
+if not static_dir.exists():
 
-    Returns:
-        HTML file response or JSON if static files not found
-    """
-    index_path = static_dir / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
-    return JSONResponse(content={
-        "message": "Nagios Public Status Page API",
-        "version": "1.0.0",
-        "docs": "/api/docs",
-        "health": "/api/health",
-    })
+    @app.get("/")
+    async def root() -> JSONResponse:
+        """Describe the API when the dashboard's static files are not installed.
+
+        With static files present, "/" is served by the dashboard mount below.
+
+        Returns:
+            JSON response pointing at the API documentation
+        """
+        return JSONResponse(content={
+            "message": "Nagios Public Status Page API",
+            "version": "1.0.0",
+            "docs": "/api/docs",
+            "health": "/api/health",
+        })
 
 
 @app.get("/api")
@@ -191,12 +202,22 @@ async def api_info() -> JSONResponse:
     )
 
 
+# Serve the dashboard at "/" straight from StaticFiles, which answers with
+# index.html (including conditional requests) without a Python handler stat-ing
+# it per request. Mounted last so it only sees paths no route matched.
+if static_dir.exists():
+    app.mount("/", StaticFiles(directory=str(static_dir), html=True), name="dashboard")
+
+
 def main() -> None:
     """Main entry point for the status page application."""
     import uvicorn
 
+    # Pass the app object, not an import string: under ``python -m`` this file
+    # runs as __main__, so uvicorn importing it by name would build the app and
+    # load the configuration a second time.
     uvicorn.run(
-        "nagios_public_status_page.main:app",
+        app,
         host=config.api.host,
         port=config.api.port,
         reload=False,
@@ -2,7 +2,7 @@
 
 from datetime import UTC, datetime
 
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 from nagios_public_status_page.db.types import UTCDateTime
@@ -33,6 +33,25 @@ class Incident(Base):
     """Track host and service incidents (problems)."""
 
     __tablename__ = "incidents"
+    __table_args__ = (
+        # Open incidents are looked up by entity on every poll; indexing only the
+        # open rows keeps the index small however long the history grows.
+        Index(
+            "ix_incidents_open_lookup",
+            "incident_type",
+            "host_name",
+            "service_description",
+            sqlite_where=text("ended_at IS NULL"),
+        ),
+        # Host and service RSS feeds select one entity's incidents newest first;
+        # the global feed uses the plain started_at index.
+        Index(
+            "ix_incidents_entity_started",
+            "host_name",
+            "service_description",
+            "started_at",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     incident_type: Mapped[str] = mapped_column(String(20))
@@ -1,23 +1,67 @@
 """Parser for Nagios status.dat files."""
 
+import contextlib
 import os
+import sys
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+# Free-text and name fields, kept as strings even when they look numeric: a
+# host named "1001" must still match "1001" in the configuration, and group
+# lists are split on commas. Skipping the numeric checks also saves work on
+# the longest values in the file.
+STRING_FIELDS = frozenset(
+    {
+        "host_name",
+        "service_description",
+        "host_groups",
+        "service_groups",
+        "plugin_output",
+        "long_plugin_output",
+        "performance_data",
+        "check_command",
+        "event_handler",
+        "check_period",
+        "notification_period",
+        "author",
+        "comment_data",
+        "version",
+    }
+)
+
+# Parsers returned by load_status_dat, most recently used last. A few entries
+# cover every (path, sections) combination one process reads.
+PARSE_CACHE_SIZE = 4
+_parse_cache_lock = threading.Lock()
+_parse_cache: OrderedDict[tuple, "StatusDatParser"] = OrderedDict()
+
 
 class StatusDatParser:
     """Parse Nagios status.dat files and extract host/service status information."""
 
-    def __init__(self, status_dat_path: str):
+    def __init__(self, status_dat_path: str, sections: Iterable[str] | None = None):
         """Initialize the parser with the path to status.dat.
 
         Args:
             status_dat_path: Path to the Nagios status.dat file
+            sections: Section names to keep (e.g. 'hoststatus'). Blocks of any
+                other section are skipped without being split into fields.
+                If None, every section is kept.
         """
         self.status_dat_path = Path(status_dat_path)
+        self.sections = frozenset(sections) if sections is not None else None
         self.data: dict[str, list[dict[str, Any]]] = {}
         self.file_mtime: datetime | None = None
+        # Per-section {group name: block positions}, built lazily by
+        # _group_positions and discarded on every parse
+        self._group_indexes: dict[str, dict[str, list[int]]] = {}
+        # {(host name, service description or None): comments}, built lazily by
+        # get_comments and discarded on every parse
+        self._comment_index: dict[tuple[str | None, str | None], list[dict[str, Any]]] | None = None
 
     def parse(self) -> dict[str, list[dict[str, Any]]]:
         """Parse the status.dat file and return structured data.
@@ -29,18 +73,24 @@ class StatusDatParser:
             FileNotFoundError: If status.dat file doesn't exist
             PermissionError: If status.dat file cannot be read
         """
-        if not self.status_dat_path.exists():
-            raise FileNotFoundError(f"Status file not found: {self.status_dat_path}")
-
-        # Get file modification time
-        stat_info = os.stat(self.status_dat_path)
-        self.file_mtime = datetime.fromtimestamp(stat_info.st_mtime, UTC)
-
         self.data = {}
+        self._group_indexes = {}
+        self._comment_index = None
         current_section = None
         current_block: dict[str, Any] = {}
 
+        # open() raises FileNotFoundError/PermissionError itself; no separate
+        # exists() check that the file could vanish after
         with open(self.status_dat_path, encoding="utf-8") as file:
+            # Stat the open descriptor, so the mtime always belongs to the file
+            # being read even if Nagios renames a new status.dat over the path
+            self.file_mtime = datetime.fromtimestamp(os.fstat(file.fileno()).st_mtime, UTC)
+            # The file is read once front to back; let the kernel read ahead
+            # aggressively. Not available on every platform, and only a hint.
+            if hasattr(os, "posix_fadvise"):
+                with contextlib.suppress(OSError):
+                    os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
             for line in file:
                 line = line.strip()
 
@@ -51,6 +101,10 @@ class StatusDatParser:
                 # Start of a new section (e.g., "hoststatus {")
                 if line.endswith("{"):
                     section_name = line[:-1].strip()
+                    # An unwanted section leaves current_section unset, so its
+                    # fields fall through every branch below
+                    if self.sections is not None and section_name not in self.sections:
+                        section_name = None
                     current_section = section_name
                     current_block = {}
 
@@ -64,13 +118,17 @@ class StatusDatParser:
                     current_block = {}
 
                 # Key-value pair within a section
-                elif "=" in line and current_section:
+                elif current_section and "=" in line:
                     key, value = line.split("=", 1)
-                    key = key.strip()
+                    # Every block repeats the same few dozen field names;
+                    # interning stores each once instead of once per block
+                    key = sys.intern(key.strip())
                     value = value.strip()
 
                     # Convert numeric strings to appropriate types
-                    if value.isdigit():
+                    if key in STRING_FIELDS:
+                        current_block[key] = value
+                    elif value.isdigit():
                         current_block[key] = int(value)
                     elif value.replace(".", "", 1).isdigit():
                         current_block[key] = float(value)
@@ -95,30 +153,11 @@ class StatusDatParser:
         Returns:
             List of host status dictionaries
         """
-        hosts = self.data.get("hoststatus", [])
-
         # If no filtering specified, return all hosts
         if not hostgroups and not explicit_hosts:
-            return hosts
-
-        filtered_hosts = []
-        for host in hosts:
-            host_name = host.get("host_name", "")
-
-            # Check if host matches explicit list
-            if explicit_hosts and host_name in explicit_hosts:
-                filtered_hosts.append(host)
-                continue
+            return self.data.get("hoststatus", [])
 
-            # Check if host matches hostgroup
-            if hostgroups:
-                host_groups = host.get("host_groups", "")
-                if host_groups:
-                    groups = [g.strip() for g in host_groups.split(",")]
-                    if any(hg in groups for hg in hostgroups):
-                        filtered_hosts.append(host)
-
-        return filtered_hosts
+        return list(self.iter_hosts(hostgroups, explicit_hosts))
 
     def get_services(
         self,
@@ -136,41 +175,205 @@ class StatusDatParser:
         Returns:
             List of service status dictionaries
         """
-        services = self.data.get("servicestatus", [])
-
         # If no filtering specified, return all services
         if not servicegroups and not explicit_services:
-            return services
+            return self.data.get("servicestatus", [])
 
-        filtered_services = []
-        for service in services:
-            host_name = service.get("host_name", "")
-            service_description = service.get("service_description", "")
+        return list(self.iter_services(servicegroups, explicit_services))
+
+    def count_host_states(
+        self,
+        hostgroups: list[str] | None = None,
+        explicit_hosts: list[str] | None = None,
+    ) -> Counter[int | None]:
+        """Count hosts by current_state, filtered as for get_hosts.
+
+        Counts while filtering, without building the filtered list.
+
+        Args:
+            hostgroups: List of hostgroup names to filter by. If None, skip
+                        hostgroup filtering.
+            explicit_hosts: List of explicit host names to include. If None, skip
+                            explicit filtering.
 
-            # Check if service matches explicit list
-            if explicit_services and (host_name, service_description) in explicit_services:
-                filtered_services.append(service)
-                continue
+        Returns:
+            Counter mapping current_state to the number of hosts in it. Hosts
+            with no current_state are counted under None, so total() still
+            counts every matching host.
+        """
+        return Counter(
+            host.get("current_state") for host in self.iter_hosts(hostgroups, explicit_hosts)
+        )
 
-            # Check if service matches servicegroup
-            if servicegroups:
-                service_groups = service.get("service_groups", "")
-                if service_groups:
-                    groups = [g.strip() for g in service_groups.split(",")]
-                    if any(sg in groups for sg in servicegroups):
-                        filtered_services.append(service)
+    def count_service_states(
+        self,
+        servicegroups: list[str] | None = None,
+        explicit_services: list[tuple[str, str]] | None = None,
+    ) -> Counter[int | None]:
+        """Count services by current_state, filtered as for get_services.
 
-        return filtered_services
+        Counts while filtering, without building the filtered list.
 
-    def get_comments(self) -> list[dict[str, Any]]:
-        """Get all comments from status.dat.
+        Args:
+            servicegroups: List of servicegroup names to filter by. If None, skip
+                           servicegroup filtering.
+            explicit_services: List of (host_name, service_description) tuples to include.
+                             If None, skip explicit filtering.
+
+        Returns:
+            Counter mapping current_state to the number of services in it.
+            Services with no current_state are counted under None, so total()
+            still counts every matching service.
+        """
+        return Counter(
+            service.get("current_state")
+            for service in self.iter_services(servicegroups, explicit_services)
+        )
+
+    def iter_hosts(
+        self,
+        hostgroups: list[str] | None = None,
+        explicit_hosts: list[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield host status blocks, filtered as for get_hosts.
+
+        For callers that only loop over the hosts once, avoiding the filtered list.
+
+        Args:
+            hostgroups: List of hostgroup names to filter by. If None, skip
+                        hostgroup filtering.
+            explicit_hosts: List of explicit host names to include. If None, skip
+                            explicit filtering.
+
+        Yields:
+            Host status dictionaries
+        """
+        hosts = self.data.get("hoststatus", [])
+
+        if not hostgroups and not explicit_hosts:
+            yield from hosts
+            return
+
+        positions = self._group_positions("hoststatus", "host_groups", hostgroups)
+        if explicit_hosts:
+            explicit = frozenset(explicit_hosts)
+            positions.update(
+                position
+                for position, host in enumerate(hosts)
+                if host.get("host_name", "") in explicit
+            )
+
+        for position in sorted(positions):
+            yield hosts[position]
+
+    def iter_services(
+        self,
+        servicegroups: list[str] | None = None,
+        explicit_services: list[tuple[str, str]] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield service status blocks, filtered as for get_services.
+
+        For callers that only loop over the services once, avoiding the filtered list.
+
+        Args:
+            servicegroups: List of servicegroup names to filter by. If None, skip
+                           servicegroup filtering.
+            explicit_services: List of (host_name, service_description) tuples to include.
+                             If None, skip explicit filtering.
+
+        Yields:
+            Service status dictionaries
+        """
+        services = self.data.get("servicestatus", [])
+
+        if not servicegroups and not explicit_services:
+            yield from services
+            return
+
+        positions = self._group_positions("servicestatus", "service_groups", servicegroups)
+        if explicit_services:
+            explicit = frozenset(explicit_services)
+            positions.update(
+                position
+                for position, service in enumerate(services)
+                if (service.get("host_name", ""), service.get("service_description", ""))
+                in explicit
+            )
+
+        for position in sorted(positions):
+            yield services[position]
+
+    def _group_positions(
+        self, section: str, groups_field: str, groups: list[str] | None
+    ) -> set[int]:
+        """Find the blocks of a section belonging to any of the given groups.
+
+        The group-to-blocks index is built on first use after each parse, so a
+        filtered lookup costs one probe per requested group rather than a scan
+        of every block's group list.
+
+        Args:
+            section: Section name, e.g. 'hoststatus'
+            groups_field: Field listing a block's groups, comma-separated
+            groups: Group names to match. If None or empty, match nothing.
+
+        Returns:
+            Positions in the section's block list, in no particular order
+        """
+        if not groups:
+            return set()
+
+        index = self._group_indexes.get(section)
+        if index is None:
+            index = {}
+            for position, block in enumerate(self.data.get(section, [])):
+                block_groups = block.get(groups_field, "")
+                if block_groups:
+                    for group in block_groups.split(","):
+                        index.setdefault(group.strip(), []).append(position)
+            self._group_indexes[section] = index
+
+        positions: set[int] = set()
+        for group in groups:
+            positions.update(index.get(group, ()))
+        return positions
+
+    def get_comments(
+        self, host_name: str | None = None, service_description: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Get comments from status.dat, optionally for one host or service.
+
+        Filtered lookups go through a (host, service) index built on first use
+        after each parse, so fetching one entity's comments does not scan them
+        all.
+
+        Args:
+            host_name: If given, only comments for this host. Without
+                service_description these are the host's own comments.
+            service_description: With host_name, only comments for this service
 
         Returns:
             List of comment dictionaries
         """
         host_comments = self.data.get("hostcomment", [])
         service_comments = self.data.get("servicecomment", [])
-        return host_comments + service_comments
+        if host_name is None:
+            return host_comments + service_comments
+
+        index = self._comment_index
+        if index is None:
+            # Built in a local and published once complete: a parser from
+            # load_status_dat is shared between threads, which must never see
+            # a half-filled index
+            index = {}
+            for comment in host_comments:
+                index.setdefault((comment.get("host_name"), None), []).append(comment)
+            for comment in service_comments:
+                key = (comment.get("host_name"), comment.get("service_description"))
+                index.setdefault(key, []).append(comment)
+            self._comment_index = index
+
+        return list(index.get((host_name, service_description), ()))
 
     def get_program_status(self) -> dict[str, Any] | None:
         """Get Nagios program status information.
@@ -206,3 +409,60 @@ class StatusDatParser:
             return None
 
         return (datetime.now(UTC) - self.file_mtime).total_seconds()
+
+
+def status_dat_signature(path: str | Path) -> tuple[int, int, int]:
+    """Return the inode, modification time and size of status.dat.
+
+    Nagios replaces status.dat atomically on every update, so these together
+    change whenever the contents do.
+
+    Args:
+        path: Path to status.dat
+
+    Returns:
+        (st_ino, st_mtime_ns, st_size)
+
+    Raises:
+        FileNotFoundError: If status.dat does not exist
+    """
+    stat_info = os.stat(path)
+    return (stat_info.st_ino, stat_info.st_mtime_ns, stat_info.st_size)
+
+
+def load_status_dat(path: str, sections: Iterable[str] | None = None) -> StatusDatParser:
+    """Return a parser holding the current contents of status.dat.
+
+    Parsers are cached by path, sections and file signature, so until Nagios
+    rewrites the file repeated calls cost one stat() and return the same
+    parser. The returned parser is shared between callers and must be treated
+    as read-only.
+
+    Parsing happens under the lock so a burst of callers arriving just after
+    an update parses the file once rather than once each.
+
+    Args:
+        path: Path to status.dat
+        sections: Section names to keep, as for StatusDatParser
+
+    Returns:
+        A parsed StatusDatParser
+
+    Raises:
+        FileNotFoundError: If status.dat does not exist
+        PermissionError: If status.dat cannot be read
+    """
+    wanted = frozenset(sections) if sections is not None else None
+    key = (str(path), wanted, status_dat_signature(path))
+
+    with _parse_cache_lock:
+        if key in _parse_cache:
+            _parse_cache.move_to_end(key)
+            return _parse_cache[key]
+
+        parser = StatusDatParser(path, sections=wanted)
+        parser.parse()
+        _parse_cache[key] = parser
+        while len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+        return parser
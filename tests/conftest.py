@@ -0,0 +1,60 @@
+"""Shared database fixtures.
+
+Modules that only need a schema and some rows share one in-memory database per
+module, and isolate tests by rolling back a transaction around each one rather
+than rebuilding the schema per test.
+"""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from nagios_public_status_page.models import Base
+
+
+@pytest.fixture(scope="module")
+def db_engine():
+    """Create one in-memory database for the module.
+
+    StaticPool hands every session the same connection, which is what lets a
+    single in-memory database outlive any one session. Tests get isolation from
+    db_connection's rollback rather than from a fresh database each.
+    """
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+
+    # pysqlite's own transaction handling defers BEGIN and commits around
+    # SAVEPOINTs; take it over so the per-test rollback really undoes the test.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_connection(db_engine):
+    """Open a transaction that is rolled back after each test."""
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    yield connection
+    # A test may have rolled back already, e.g. to check the isolation itself
+    if transaction.is_active:
+        transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def db_session(db_connection):
+    """Session whose commits only release a SAVEPOINT in the test's transaction."""
+    session = Session(bind=db_connection, join_transaction_mode="create_savepoint")
+    yield session
+    session.close()
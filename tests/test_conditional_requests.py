@@ -0,0 +1,198 @@
+"""Tests for the status.dat-backed endpoints: ETags, parse reuse and counts.
+
+Dashboards poll /api/status, /api/hosts and /api/services continuously, and
+between Nagios updates every one of those requests used to re-parse status.dat
+and re-serialise the same payload. The endpoints now tag each response with an
+ETag derived from the status.dat file identity (plus, for /status, the
+database-backed fields), and answer a matching If-None-Match with an empty 304.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from nagios_public_status_page.api.routes import get_config, get_db, get_poller
+from nagios_public_status_page.config import Config, DatabaseConfig, NagiosConfig
+from nagios_public_status_page.main import app
+from nagios_public_status_page.models import Base
+
+FIXTURE = Path(__file__).parent / "fixtures" / "sample_status.dat"
+
+
+@pytest.fixture
+def status_dat(tmp_path):
+    """Copy the sample status.dat somewhere a test may modify it."""
+    path = tmp_path / "status.dat"
+    shutil.copy(FIXTURE, path)
+    return path
+
+
+@pytest.fixture
+def client(status_dat):
+    """Test client reading status_dat, with a private database and no poller."""
+    from nagios_public_status_page.db import database as database_module
+
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as temp_db:
+        db_path = temp_db.name
+
+    # /api/status reads poll metadata through a StatusPoller, which binds to the
+    # get_database() singleton -- isolate it, as the poller tests do.
+    previous = database_module._db_instance
+    database_module._db_instance = None
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+
+    def override_get_db():
+        session = sessionmaker(bind=engine)()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    config = Config(
+        nagios=NagiosConfig(status_dat_path=str(status_dat)),
+        database=DatabaseConfig(path=db_path),
+    )
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_config] = lambda: config
+    app.dependency_overrides[get_poller] = lambda: None
+
+    yield TestClient(app)
+
+    app.dependency_overrides.clear()
+    engine.dispose()
+    database_module._db_instance = previous
+    Path(db_path).unlink(missing_ok=True)
+
+
+@pytest.mark.parametrize("path", ["/api/status", "/api/hosts", "/api/services"])
+def test_response_carries_an_etag(client, path):
+    """A full response advertises the ETag a client should revalidate with."""
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert response.headers["ETag"].startswith('"')
+
+
+@pytest.mark.parametrize("path", ["/api/status", "/api/hosts", "/api/services"])
+def test_matching_if_none_match_returns_304(client, path):
+    """An unchanged status.dat short-circuits to an empty 304."""
+    etag = client.get(path).headers["ETag"]
+
+    response = client.get(path, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+
+def test_weak_and_listed_validators_match(client):
+    """W/ prefixes and comma-separated lists are honoured, per RFC 9110."""
+    etag = client.get("/api/hosts").headers["ETag"]
+
+    response = client.get("/api/hosts", headers={"If-None-Match": f'"stale", W/{etag}'})
+
+    assert response.status_code == 304
+
+
+def test_status_dat_update_invalidates_the_etag(client, status_dat):
+    """A new status.dat must never be answered with 304 for the old one."""
+    etag = client.get("/api/hosts").headers["ETag"]
+
+    stat_info = status_dat.stat()
+    os.utime(status_dat, ns=(stat_info.st_atime_ns, stat_info.st_mtime_ns + 1_000_000_000))
+
+    response = client.get("/api/hosts", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert len(response.json()) == 3
+
+
+def test_unchanged_status_dat_is_parsed_once(client, monkeypatch):
+    """Requests between Nagios updates reuse a single parse of status.dat."""
+    from nagios_public_status_page.parser.status_dat import StatusDatParser
+
+    calls = []
+    original_parse = StatusDatParser.parse
+
+    def counting_parse(self):
+        calls.append(self.status_dat_path)
+        return original_parse(self)
+
+    monkeypatch.setattr(StatusDatParser, "parse", counting_parse)
+
+    for path in ("/api/status", "/api/hosts", "/api/services", "/api/hosts"):
+        assert client.get(path).status_code == 200
+
+    assert len(calls) == 1
+
+
+def test_status_dat_update_is_reparsed(client, status_dat):
+    """A rewritten status.dat is picked up on the next request."""
+    assert len(client.get("/api/hosts").json()) == 3
+
+    contents = status_dat.read_text(encoding="utf-8")
+    first_host = contents.index("hoststatus {")
+    end_of_block = contents.index("}", first_host) + 1
+    status_dat.write_text(contents[:first_host] + contents[end_of_block:], encoding="utf-8")
+
+    assert len(client.get("/api/hosts").json()) == 2
+
+
+def test_status_counts_each_state(client):
+    """The summary counts match the states in the sample status.dat."""
+    summary = client.get("/api/status").json()
+
+    assert (summary["total_hosts"], summary["hosts_up"], summary["hosts_down"]) == (3, 2, 1)
+    assert summary["hosts_unreachable"] == 0
+    assert summary["total_services"] == 4
+    assert (summary["services_ok"], summary["services_warning"]) == (2, 1)
+    assert (summary["services_critical"], summary["services_unknown"]) == (1, 0)
+
+
+def test_host_and_service_rows(client):
+    """Rows carry state names and problem flags derived from current_state."""
+    hosts = {h["host_name"]: h for h in client.get("/api/hosts").json()}
+    services = {
+        (s["host_name"], s["service_description"]): s for s in client.get("/api/services").json()
+    }
+
+    assert hosts["dbserver01"]["state_name"] == "DOWN"
+    assert hosts["dbserver01"]["is_problem"] is True
+    assert hosts["dbserver01"]["last_check"] == "2024-01-11T07:59:50"
+    assert hosts["webserver01"]["state_name"] == "UP"
+    assert hosts["webserver01"]["is_problem"] is False
+    assert services[("dbserver01", "MySQL")]["state_name"] == "CRITICAL"
+    assert services[("dbserver01", "MySQL")]["is_problem"] is True
+    assert services[("webserver01", "HTTP")]["state_name"] == "OK"
+    assert services[("webserver01", "HTTP")]["is_problem"] is False
+
+
+@pytest.mark.parametrize("path", ["/api/hosts", "/api/services"])
+def test_unchanged_body_is_reused_without_if_none_match(client, monkeypatch, path):
+    """Plain repeat requests reuse the serialised body until status.dat changes."""
+    from nagios_public_status_page.api import routes
+
+    calls = []
+    original = routes._parsed_status_dat
+
+    def counting(config):
+        calls.append(config)
+        return original(config)
+
+    monkeypatch.setattr(routes, "_parsed_status_dat", counting)
+
+    first = client.get(path)
+    second = client.get(path)
+
+    assert first.content == second.content
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert len(calls) == 1
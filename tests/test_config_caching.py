@@ -169,3 +169,19 @@ def test_write_endpoint_auth_still_works_with_cached_config(isolated_database):
         assert response.status_code in (200, 500)  # 500 = no status.dat file
     finally:
         app.dependency_overrides.pop(get_config, None)
+
+
+def test_lifespan_sizes_the_request_threadpool(isolated_database, monkeypatch):
+    """Sync route handlers get exactly api.worker_threads threads to run on."""
+    import anyio.to_thread
+
+    from nagios_public_status_page import main as main_module
+
+    monkeypatch.setenv("NAGIOS_STATUS_DAT_PATH", "/nonexistent/status.dat")
+    monkeypatch.setattr(main_module.config.api, "worker_threads", 7)
+
+    async def thread_limit():
+        return anyio.to_thread.current_default_thread_limiter().total_tokens
+
+    with TestClient(app) as client:
+        assert client.portal.call(thread_limit) == 7
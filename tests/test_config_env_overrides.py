@@ -190,6 +190,13 @@ def test_incidents_and_comments_overrides(config_file, monkeypatch):
     assert config.comments.pull_nagios_comments is False
 
 
+def test_api_worker_threads_override(config_file, monkeypatch):
+    """API_WORKER_THREADS sizes the request threadpool."""
+    monkeypatch.setenv("API_WORKER_THREADS", "64")
+
+    assert load_config(config_file).api.worker_threads == 64
+
+
 def test_config_yaml_is_not_tracked():
     """config.yaml holds per-deployment values and credentials; keep it untracked.
 
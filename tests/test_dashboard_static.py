@@ -0,0 +1,53 @@
+"""Tests for serving the dashboard's static files.
+
+"/" is served by a StaticFiles mount with html=True rather than a route
+handler, so it must not shadow the API and feed routes registered before it.
+"""
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from nagios_public_status_page.main import app
+
+STATIC_DIR = Path(__file__).parent.parent / "static"
+
+
+@pytest.fixture
+def client():
+    """Test client without the lifespan, so no poller is started."""
+    return TestClient(app)
+
+
+def test_root_serves_the_dashboard(client):
+    """"/" returns static/index.html."""
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.content == (STATIC_DIR / "index.html").read_bytes()
+
+
+def test_dashboard_supports_conditional_requests(client):
+    """Browsers revalidating the dashboard get a 304 from StaticFiles."""
+    etag = client.get("/").headers["ETag"]
+
+    response = client.get("/", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+
+
+def test_routes_take_precedence_over_the_dashboard_mount(client):
+    """The catch-all mount only sees paths no route matched."""
+    response = client.get("/api")
+
+    assert response.status_code == 200
+    assert "endpoints" in response.json()
+
+
+def test_static_assets_are_still_served(client):
+    """Asset URLs used by index.html keep working."""
+    response = client.get("/static/css/style.css")
+
+    assert response.status_code == 200
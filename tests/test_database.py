@@ -0,0 +1,86 @@
+"""Tests for database engine setup."""
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from nagios_public_status_page.db.database import POOL_SIZE, Database
+
+
+@pytest.fixture
+def database(tmp_path):
+    """An initialised database in a temporary directory."""
+    db = Database(str(tmp_path / "status.db"))
+    db.initialize()
+    yield db
+    db.close()
+
+
+def test_engine_uses_a_sized_queue_pool(database):
+    """The pool is a QueuePool sized for the request threadpool."""
+    pool = database.engine.pool
+
+    assert isinstance(pool, QueuePool)
+    assert pool.size() == POOL_SIZE
+
+
+def test_sessions_in_concurrent_threads_get_their_own_connections(database):
+    """Concurrent request threads are not funnelled through one connection."""
+    workers = 8
+    barrier = Barrier(workers)
+
+    def connection_id(_):
+        session = database.get_session()
+        try:
+            session.execute(text("SELECT 1"))
+            # Hold the connection until every worker has checked one out.
+            barrier.wait(timeout=5)
+            return id(session.connection().connection.dbapi_connection)
+        finally:
+            session.close()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        ids = set(executor.map(connection_id, range(workers)))
+
+    assert len(ids) == workers
+
+
+def test_connections_use_wal_with_normal_sync(database):
+    """Every pooled connection is switched to WAL with synchronous=NORMAL."""
+    with database.engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        # 1 == NORMAL (FULL, the rollback-journal default, is 2)
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+
+
+def test_open_incident_lookup_uses_the_partial_index(database):
+    """Looking up an entity's open incident probes the index, not the table."""
+    with database.engine.connect() as connection:
+        plan = connection.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM incidents WHERE incident_type = 'host'"
+                " AND host_name = 'web01' AND service_description IS NULL"
+                " AND ended_at IS NULL"
+            )
+        ).all()
+
+    assert any("ix_incidents_open_lookup" in row[-1] for row in plan)
+
+
+def test_service_feed_query_uses_the_entity_index(database):
+    """A per-service feed is read in started_at order straight from the index."""
+    with database.engine.connect() as connection:
+        plan = connection.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM incidents WHERE host_name = 'web01'"
+                " AND service_description = 'HTTP' AND started_at >= '2024-01-01'"
+                " ORDER BY started_at DESC"
+            )
+        ).all()
+
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_incidents_entity_started" in details
+    assert "TEMP B-TREE" not in details
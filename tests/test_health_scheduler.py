@@ -195,3 +195,58 @@ def test_lifespan_attaches_the_poller_to_app_state(monkeypatch, db_engine):
 
     # Shutdown clears it so a stale instance cannot be reported later.
     assert app.state.poller is None
+
+
+def test_health_probe_bursts_are_computed_once(client, poller, monkeypatch):
+    """Probes within the TTL reuse one result; a manual poll invalidates it."""
+    from nagios_public_status_page.api import routes
+
+    calls = []
+    original = routes._build_health
+
+    def counting(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(routes, "_build_health", counting)
+    monkeypatch.setattr(routes, "HEALTH_CACHE_TTL_SECONDS", 60)
+    app.dependency_overrides[get_poller] = lambda: poller
+    app.dependency_overrides[verify_write_access] = lambda: None
+
+    for _ in range(3):
+        assert client.get("/api/health").status_code == 200
+    assert len(calls) == 1
+
+    assert client.post("/api/poll").status_code == 200
+    assert client.get("/api/health").json()["last_poll_time"] is not None
+    assert len(calls) == 2
+
+
+def test_health_cache_clear_is_not_undone_by_a_build_in_progress():
+    """A clear arriving mid-build waits for it, so the stale result is not kept."""
+    import threading
+
+    from nagios_public_status_page.api.routes import _HealthCache
+
+    cache = _HealthCache()
+    building = threading.Event()
+    release = threading.Event()
+    builds = []
+
+    def slow_build():
+        builds.append("slow")
+        building.set()
+        release.wait(timeout=5)
+        return "stale"
+
+    prober = threading.Thread(target=cache.get_or_build, args=(("key",), 60, slow_build))
+    prober.start()
+    building.wait(timeout=5)
+    clearer = threading.Thread(target=cache.clear)
+    clearer.start()
+    release.set()
+    prober.join(timeout=5)
+    clearer.join(timeout=5)
+
+    assert cache.get_or_build(("key",), 60, lambda: "fresh") == "fresh"
+    assert builds == ["slow"]
@@ -7,7 +7,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from nagios_public_status_page.collector.incident_tracker import IncidentTracker
-from nagios_public_status_page.models import Base, Incident, NagiosComment
+from nagios_public_status_page.models import Base, Comment, Incident, NagiosComment
 
 
 @pytest.fixture
@@ -164,6 +164,7 @@ def test_get_active_incidents(tracker, db_session):
     active = tracker.get_active_incidents()
     assert len(active) == 2
     assert all(inc.ended_at is None for inc in active)
+    assert tracker.count_active_incidents() == 2
 
 
 def test_get_recent_incidents(tracker, db_session):
@@ -195,6 +196,39 @@ def test_get_recent_incidents(tracker, db_session):
     assert recent[0].host_name == "newserver"
 
 
+def test_incident_rows_match_orm_listings(tracker, db_session):
+    """The row variants return the same incidents, with is_active, as plain mappings."""
+    db_session.add(
+        Incident(
+            incident_type="host",
+            host_name="oldserver",
+            state="DOWN",
+            started_at=datetime.now(UTC) - timedelta(hours=48),
+            ended_at=datetime.now(UTC) - timedelta(hours=47),
+        )
+    )
+    for name, state in (("down1", 1), ("down2", 1), ("up", 0)):
+        tracker.process_host(
+            {"host_name": name, "current_state": state, "last_check": datetime.now(UTC).timestamp()}
+        )
+    tracker.process_host(
+        {"host_name": "down2", "current_state": 0, "last_check": datetime.now(UTC).timestamp()}
+    )
+
+    active = tracker.get_active_incident_rows()
+    recent = tracker.get_recent_incident_rows(hours=24)
+
+    assert [row["id"] for row in active] == [inc.id for inc in tracker.get_active_incidents()]
+    assert [row["id"] for row in recent] == [
+        inc.id for inc in tracker.get_recent_incidents(hours=24)
+    ]
+    assert {row["host_name"]: row["is_active"] for row in recent} == {
+        "down1": True,
+        "down2": False,
+    }
+    assert recent[0]["started_at"].tzinfo is not None
+
+
 def test_process_nagios_comment(tracker, db_session):
     """Test processing Nagios comments."""
     comment_data = {
@@ -280,6 +314,44 @@ def test_cleanup_old_incidents(tracker, db_session):
     assert remaining[0].host_name == "recentserver"
 
 
+def test_cleanup_old_incidents_removes_their_comments(tracker, db_session):
+    """Cleanup deletes the comments of the incidents it removes, and no others."""
+    ended = datetime.now(UTC) - timedelta(days=40)
+    old_incident = Incident(
+        incident_type="host",
+        host_name="oldserver",
+        state="DOWN",
+        started_at=ended,
+        ended_at=ended,
+    )
+    db_session.add(old_incident)
+    db_session.flush()
+    db_session.add_all([
+        Comment(incident_id=old_incident.id, author="ops", comment_text="Investigating"),
+        NagiosComment(
+            incident_id=old_incident.id,
+            entry_time=ended,
+            author="nagios",
+            comment_data="Ack",
+            host_name="oldserver",
+        ),
+        NagiosComment(
+            incident_id=None,
+            entry_time=ended,
+            author="nagios",
+            comment_data="Unlinked",
+            host_name="otherserver",
+        ),
+    ])
+    db_session.commit()
+
+    assert tracker.cleanup_old_incidents(days=30) == 1
+
+    assert db_session.query(Comment).count() == 0
+    remaining = db_session.query(NagiosComment).all()
+    assert [c.comment_data for c in remaining] == ["Unlinked"]
+
+
 def test_state_name_conversion(tracker):
     """Test state code to name conversion."""
     assert tracker._get_state_name("host", 0) == "UP"
@@ -296,3 +368,49 @@ def test_is_problem_state(tracker):
     assert not tracker._is_problem_state("service", 0)  # OK
     assert tracker._is_problem_state("service", 1)  # WARNING
     assert tracker._is_problem_state("service", 2)  # CRITICAL
+
+
+def test_preloaded_tracker_follows_opened_and_closed_incidents(tracker, db_session):
+    """After preloading, lookups track incidents the tracker opens and closes."""
+    existing = Incident(
+        incident_type="service",
+        host_name="webserver01",
+        service_description="HTTP",
+        state="CRITICAL",
+        started_at=datetime.now(UTC),
+    )
+    db_session.add(existing)
+    db_session.commit()
+
+    tracker.preload_open_incidents()
+    assert tracker.find_open_incident("service", "webserver01", "HTTP") is existing
+
+    now = datetime.now(UTC).timestamp()
+    opened = tracker.process_host(
+        {"host_name": "dbserver01", "current_state": 1, "last_check": now}
+    )
+    assert tracker.find_open_incident("host", "dbserver01") is opened
+
+    tracker.process_service(
+        {
+            "host_name": "webserver01",
+            "service_description": "HTTP",
+            "current_state": 0,
+            "last_check": now,
+        }
+    )
+    assert tracker.find_open_incident("service", "webserver01", "HTTP") is None
+
+
+def test_process_without_last_check_uses_given_now(tracker):
+    """A status with no last_check is stamped with the caller's poll time."""
+    now = datetime(2024, 1, 11, 8, 0, tzinfo=UTC)
+
+    host = tracker.process_host({"host_name": "dbserver01", "current_state": 1}, now)
+    service = tracker.process_service(
+        {"host_name": "dbserver01", "service_description": "MySQL", "current_state": 2},
+        now,
+    )
+
+    assert host.started_at == host.last_check == now
+    assert service.started_at == service.last_check == now
@@ -1,10 +1,11 @@
 """Tests for the status.dat parser."""
 
+import os
 from pathlib import Path
 
 import pytest
 
-from nagios_public_status_page.parser.status_dat import StatusDatParser
+from nagios_public_status_page.parser.status_dat import StatusDatParser, load_status_dat
 
 
 @pytest.fixture
@@ -62,6 +63,22 @@ def test_parser_filters_hosts_multiple_hostgroups(parser):
     assert len(hosts) == 3  # All hosts match at least one group
 
 
+def test_parser_combines_explicit_hosts_and_hostgroups(parser):
+    """Test hosts named explicitly are included alongside hostgroup members."""
+    hosts = parser.get_hosts(hostgroups=["public-status"], explicit_hosts=["internal-server"])
+    assert sorted(h["host_name"] for h in hosts) == [
+        "dbserver01", "internal-server", "webserver01",
+    ]
+
+
+def test_parser_iterates_hosts_as_get_hosts_filters(parser):
+    """Test iter_hosts yields exactly what get_hosts returns."""
+    assert list(parser.iter_hosts(hostgroups=["public-status"])) == parser.get_hosts(
+        hostgroups=["public-status"]
+    )
+    assert list(parser.iter_services()) == parser.get_services()
+
+
 def test_parser_gets_services(parser):
     """Test parser can extract all services."""
     services = parser.get_services()
@@ -86,6 +103,35 @@ def test_parser_filters_services_by_servicegroup(parser):
     assert "Disk Space" not in service_descs
 
 
+def test_parser_combines_explicit_services_and_servicegroups(parser):
+    """Test services named explicitly are included alongside servicegroup members."""
+    services = parser.get_services(
+        servicegroups=["public-status-services"],
+        explicit_services=[("internal-server", "Disk Space")],
+    )
+    assert len(services) == 4
+
+
+def test_parser_counts_host_states(parser):
+    """Test parser counts host states under the same filters as get_hosts."""
+    assert parser.count_host_states() == {0: 2, 1: 1}
+    assert parser.count_host_states(hostgroups=["public-status"]) == {0: 1, 1: 1}
+    assert parser.count_host_states(explicit_hosts=["internal-server"]) == {0: 1}
+
+
+def test_parser_counts_service_states(parser):
+    """Test parser counts service states under the same filters as get_services."""
+    assert parser.count_service_states() == {0: 2, 1: 1, 2: 1}
+    assert parser.count_service_states(servicegroups=["public-status-services"]) == {
+        0: 1,
+        1: 1,
+        2: 1,
+    }
+    assert parser.count_service_states(
+        explicit_services=[("internal-server", "Disk Space")]
+    ) == {0: 1}
+
+
 def test_parser_extracts_host_state(parser):
     """Test parser correctly extracts host states."""
     hosts = parser.get_hosts()
@@ -166,9 +212,10 @@ def test_parser_type_conversion(parser):
     assert isinstance(webserver["plugin_output"], str)
 
 
-def test_parser_file_mtime_tracking(parser):
+def test_parser_file_mtime_tracking(parser, sample_status_dat):
     """Test parser tracks file modification time."""
     assert parser.file_mtime is not None
+    assert parser.file_mtime.timestamp() == sample_status_dat.stat().st_mtime
 
 
 def test_parser_data_age(parser):
@@ -193,3 +240,94 @@ def test_parser_missing_file():
 
     with pytest.raises(FileNotFoundError):
         parser.parse()
+
+
+def test_parser_keeps_only_requested_sections(sample_status_dat):
+    """Test blocks outside the requested sections are skipped."""
+    parser = StatusDatParser(sample_status_dat, sections=["hoststatus", "hostcomment"])
+    data = parser.parse()
+
+    assert set(data) == {"hoststatus", "hostcomment"}
+    assert len(parser.get_hosts()) == 3
+    assert parser.get_services() == []
+    assert parser.get_program_status() is None
+
+
+def test_parser_group_filter_follows_a_reparse(sample_status_dat, tmp_path):
+    """Test the hostgroup index is rebuilt when status.dat is parsed again."""
+    status_dat = tmp_path / "status.dat"
+    status_dat.write_text(sample_status_dat.read_text(encoding="utf-8"), encoding="utf-8")
+    parser = StatusDatParser(status_dat)
+    parser.parse()
+    assert len(parser.get_hosts(hostgroups=["internal-only"])) == 1
+
+    contents = status_dat.read_text(encoding="utf-8")
+    status_dat.write_text(contents.replace("internal-only", "public-status"), encoding="utf-8")
+    parser.parse()
+
+    assert parser.get_hosts(hostgroups=["internal-only"]) == []
+    assert len(parser.get_hosts(hostgroups=["public-status"])) == 3
+
+
+def test_load_status_dat_reuses_parse_until_file_changes(sample_status_dat, tmp_path):
+    """Test load_status_dat returns the cached parser until status.dat is rewritten."""
+    status_dat = tmp_path / "status.dat"
+    status_dat.write_text(sample_status_dat.read_text(encoding="utf-8"), encoding="utf-8")
+
+    first = load_status_dat(str(status_dat), sections=["hoststatus"])
+    assert load_status_dat(str(status_dat), sections=["hoststatus"]) is first
+    assert load_status_dat(str(status_dat)) is not first
+
+    stat_info = status_dat.stat()
+    os.utime(status_dat, ns=(stat_info.st_atime_ns, stat_info.st_mtime_ns + 1_000_000_000))
+
+    assert load_status_dat(str(status_dat), sections=["hoststatus"]) is not first
+
+
+def test_parser_gets_comments_for_one_entity(parser):
+    """Test comments can be fetched for a single host or service."""
+    host_comments = parser.get_comments(host_name="dbserver01")
+    service_comments = parser.get_comments(host_name="webserver01", service_description="HTTPS")
+
+    assert [c["author"] for c in host_comments] == ["admin"]
+    assert [c["author"] for c in service_comments] == ["sysadmin"]
+    assert parser.get_comments(host_name="webserver01") == []
+    assert parser.get_comments(host_name="nonexistent") == []
+
+
+def test_parser_advises_sequential_reads(sample_status_dat, monkeypatch):
+    """Test the parser hints that status.dat is read front to back."""
+    if not hasattr(os, "posix_fadvise"):
+        pytest.skip("posix_fadvise is not available on this platform")
+
+    advice = []
+    monkeypatch.setattr(os, "posix_fadvise", lambda fd, offset, length, hint: advice.append(hint))
+
+    StatusDatParser(sample_status_dat).parse()
+
+    assert advice == [os.POSIX_FADV_SEQUENTIAL]
+
+
+def test_parser_shares_field_names_between_blocks(parser):
+    """Test every block's field names are the same interned strings."""
+    first, second = parser.get_hosts()[:2]
+
+    first_key = next(key for key in first if key == "current_state")
+    second_key = next(key for key in second if key == "current_state")
+    assert first_key is second_key
+
+
+def test_parser_keeps_numeric_looking_names_as_strings(tmp_path):
+    """Test name and group fields stay strings even when they are all digits."""
+    status_dat = tmp_path / "status.dat"
+    status_dat.write_text(
+        "hoststatus {\n\thost_name=1001\n\thost_groups=42\n\tcurrent_state=0\n\t}\n",
+        encoding="utf-8",
+    )
+    parser = StatusDatParser(status_dat)
+    parser.parse()
+
+    host = parser.get_hosts()[0]
+    assert host["host_name"] == "1001"
+    assert host["current_state"] == 0
+    assert parser.get_hosts(hostgroups=["42"]) == [host]
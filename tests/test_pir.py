@@ -1,61 +1,48 @@
 """Tests for Post-Incident Review (PIR) functionality."""
 
-import tempfile
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
 from nagios_public_status_page.main import app
-from nagios_public_status_page.models import Base, Incident
+from nagios_public_status_page.models import Comment, Incident, NagiosComment
 
 
-@pytest.fixture(scope="function")
-def db_engine():
-    """Create a temporary file-based database engine for testing."""
-    # Create a temporary database file
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as temp_db:
-        db_path = temp_db.name
+@pytest.fixture(scope="module")
+def module_client():
+    """Create one test client for the module, serving whichever connection is current.
 
-    engine = create_engine(f"sqlite:///{db_path}")
-    Base.metadata.create_all(engine)
-    yield engine
-    engine.dispose()
-
-    # Clean up
-    Path(db_path).unlink(missing_ok=True)
-
-
-@pytest.fixture
-def db_session(db_engine):
-    """Create a database session for testing."""
-    Session = sessionmaker(bind=db_engine)
-    session = Session()
-    yield session
-    session.close()
-
-
-@pytest.fixture
-def client(db_engine):
-    """Create a test client with database dependency override."""
+    Overriding get_db and building the TestClient happen once; each test points
+    the override at its own rolled-back connection through the returned list.
+    """
     from nagios_public_status_page.api.routes import get_db
 
+    current_connection = []
+
     def override_get_db():
-        Session = sessionmaker(bind=db_engine)
-        session = Session()
+        session = Session(bind=current_connection[0], join_transaction_mode="create_savepoint")
         try:
             yield session
         finally:
             session.close()
 
     app.dependency_overrides[get_db] = override_get_db
-    yield TestClient(app)
+    yield TestClient(app), current_connection
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def client(module_client, db_connection):
+    """Return the module's test client, bound to this test's connection."""
+    test_client, current_connection = module_client
+    current_connection[:] = [db_connection]
+    yield test_client
+    current_connection.clear()
+
+
 @pytest.fixture
 def sample_incident(db_session):
     """Create a sample incident for testing."""
@@ -241,3 +228,57 @@ def test_update_pir_url_multiple_times(client, sample_incident, db_session):
 
     # Should require authentication
     assert response.status_code == 401
+
+
+def test_get_incident_loads_comments_in_two_queries(client, sample_incident, db_session, db_engine):
+    """GET /api/incidents/{id} fetches both comment lists without lazy loads."""
+    now = datetime.now(UTC)
+    db_session.add_all(
+        [
+            Comment(incident_id=sample_incident.id, author="ops", comment_text="one"),
+            Comment(incident_id=sample_incident.id, author="ops", comment_text="two"),
+            NagiosComment(
+                incident_id=sample_incident.id,
+                entry_time=now,
+                author="nagiosadmin",
+                comment_data="Investigating",
+                host_name="webserver01",
+            ),
+        ]
+    )
+    db_session.commit()
+    incident_id = sample_incident.id
+
+    statements = []
+
+    def record(_conn, _cursor, statement, *_args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", record)
+    try:
+        response = client.get(f"/api/incidents/{incident_id}")
+    finally:
+        event.remove(db_engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["comments"]) == 2
+    assert len(data["nagios_comments"]) == 1
+    assert len(statements) == 2
+
+
+def test_rolling_back_the_test_transaction_discards_commits(db_engine, db_connection, db_session):
+    """Rows a test commits through db_session are undone by db_connection's rollback."""
+    now = datetime.now(UTC)
+    db_session.add(
+        Incident(incident_type="host", host_name="isolation01", state="DOWN", started_at=now)
+    )
+    db_session.commit()
+    assert db_session.query(Incident).count() == 1
+
+    db_connection.get_transaction().rollback()
+
+    with Session(db_engine) as fresh_session:
+        assert fresh_session.query(Incident).count() == 0
+        assert fresh_session.query(Comment).count() == 0
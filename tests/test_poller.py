@@ -0,0 +1,303 @@
+"""Tests for the poller's database access pattern.
+
+A poll touches every monitored host, service and Nagios comment, so the number
+of statements it issues scales with the size of the installation. These tests
+run full polls against the sample status.dat and check both the outcome and how
+the work reaches SQLite.
+"""
+
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+
+from nagios_public_status_page.collector.poller import CLEANUP_HOUR, StatusPoller
+from nagios_public_status_page.config import Config, DatabaseConfig, NagiosConfig
+from nagios_public_status_page.models import Incident, NagiosComment, PollMetadata
+from nagios_public_status_page.parser.status_dat import StatusDatParser
+
+
+@pytest.fixture
+def status_dat(tmp_path):
+    """Copy the sample status.dat somewhere a test may modify it."""
+    path = tmp_path / "status.dat"
+    shutil.copy(Path(__file__).parent / "fixtures" / "sample_status.dat", path)
+    return path
+
+
+@pytest.fixture
+def poller(status_dat):
+    """Return a poller wired to a copy of the sample status.dat and a temporary database."""
+    from nagios_public_status_page.db import database as database_module
+
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as temp_db:
+        db_path = temp_db.name
+
+    previous_instance = database_module._db_instance
+    database_module._db_instance = None
+
+    config = Config(
+        nagios=NagiosConfig(status_dat_path=str(status_dat)),
+        database=DatabaseConfig(path=db_path),
+    )
+
+    poller = StatusPoller(config)
+    yield poller
+
+    poller.db.close()
+    database_module._db_instance = previous_instance
+    Path(db_path).unlink(missing_ok=True)
+
+
+@pytest.fixture
+def statements(poller):
+    """Record every SQL statement the poller's engine executes."""
+    executed: list[str] = []
+
+    def record(_conn, _cursor, statement, _parameters, _context, _executemany):
+        executed.append(statement)
+
+    event.listen(poller.db.engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(poller.db.engine, "before_cursor_execute", record)
+
+
+def test_comments_link_to_active_incidents(poller):
+    """Host and service comments attach to the matching open incident."""
+    poller.poll()
+
+    session = poller._get_session()
+    try:
+        comments = {c.host_name: c for c in session.query(NagiosComment).all()}
+
+        assert comments["dbserver01"].incident.incident_type == "host"
+        assert comments["webserver01"].incident.service_description == "HTTPS"
+    finally:
+        session.close()
+
+
+def test_comment_without_host_name_is_skipped(poller, status_dat):
+    """A comment block missing host_name is ignored rather than looked up."""
+    with status_dat.open("a", encoding="utf-8") as file:
+        file.write("\nhostcomment {\n\tentry_time=1704958100\n\tauthor=admin\n\t}\n")
+
+    results = poller.poll()
+
+    assert results["comments_processed"] == 2
+
+
+def test_poll_loads_open_incidents_once(poller, statements):
+    """Hosts, services and comments are matched from one preload of open incidents."""
+    poller.poll()
+
+    incident_selects = [
+        s for s in statements
+        if s.lstrip().startswith("SELECT") and "FROM incidents" in s
+        and "incidents.ended_at IS NULL" in s
+    ]
+    assert len(incident_selects) == 1
+    assert "LIMIT" not in incident_selects[0]
+
+
+def _touch(path):
+    """Move path's mtime forward a second, as a Nagios status.dat rewrite would."""
+    stat_info = path.stat()
+    os.utime(path, ns=(stat_info.st_atime_ns, stat_info.st_mtime_ns + 1_000_000_000))
+
+
+def test_second_poll_updates_preloaded_incidents(poller, status_dat):
+    """Open incidents from an earlier poll are found again, not duplicated."""
+    poller.poll()
+    _touch(status_dat)
+    results = poller.poll()
+
+    assert results["incidents_created"] == 0
+    assert results["incidents_updated"] == 3
+
+
+def test_poll_commits_once(poller):
+    """A poll's incidents, comments and metadata are written in one transaction."""
+    commits = []
+    event.listen(poller.db.engine, "commit", lambda _conn: commits.append(True))
+
+    results = poller.poll()
+
+    assert results["incidents_created"] == 3
+    assert results["comments_processed"] == 2
+    assert len(commits) == 1
+
+
+def test_recoveries_are_written_as_one_batched_update(poller, status_dat, statements):
+    """Incidents closed in one poll share a single executemany UPDATE."""
+    poller.poll()
+    contents = status_dat.read_text(encoding="utf-8")
+    status_dat.write_text(re.sub(r"current_state=\d", "current_state=0", contents), encoding="utf-8")
+    statements.clear()
+
+    results = poller.poll()
+
+    updates = [s for s in statements if s.startswith("UPDATE incidents")]
+    assert results["incidents_closed"] == 3
+    assert updates == ["UPDATE incidents SET ended_at=? WHERE incidents.id = ?"]
+
+
+def test_unchanged_status_dat_skips_processing(poller, monkeypatch):
+    """A poll of an unchanged status.dat records metadata but does no parsing."""
+    first = poller.poll()
+
+    parses = []
+    monkeypatch.setattr(StatusDatParser, "parse", lambda self: parses.append(self))
+    second = poller.poll()
+
+    assert parses == []
+    assert second["hosts_processed"] == 0
+    # The fixture's fixed mtime is still reported as stale
+    assert second["errors"] == first["errors"]
+
+    session = poller._get_session()
+    try:
+        polls = session.query(PollMetadata).order_by(PollMetadata.id).all()
+        assert len(polls) == 2
+        assert polls[1].records_processed == polls[0].records_processed == 7
+    finally:
+        session.close()
+
+
+def test_changed_status_dat_is_processed(poller, status_dat):
+    """A rewritten status.dat is parsed and processed again."""
+    poller.poll()
+    _touch(status_dat)
+
+    results = poller.poll()
+
+    assert results["hosts_processed"] == 3
+    assert results["services_processed"] == 4
+
+
+def test_scheduler_runs_polls_on_a_single_worker(poller):
+    """Polls never overlap, so the scheduler keeps just one worker thread."""
+    executor = poller.scheduler._lookup_executor("default")
+
+    assert executor._pool._max_workers == 1
+
+
+def test_poll_job_coalesces_missed_runs(poller, monkeypatch):
+    """Missed runs behind a slow poll collapse into one instead of stacking."""
+    monkeypatch.setattr(poller, "_poll_wrapper", lambda: None)
+    poller.start()
+    try:
+        job = poller.scheduler.get_job("status_poll")
+
+        assert job.max_instances == 1
+        assert job.coalesce is True
+        assert job.misfire_grace_time == poller.config.polling.interval_seconds
+    finally:
+        poller.stop()
+
+
+def test_last_poll_is_served_from_memory(poller, statements):
+    """After a poll, staleness checks read the recorded metadata, not the database."""
+    poller.poll()
+    statements.clear()
+
+    last_poll = poller.get_last_poll()
+    poller.is_data_stale()
+
+    assert last_poll.records_processed == 7
+    assert statements == []
+
+
+def test_last_poll_falls_back_to_the_database(poller):
+    """A new poller finds metadata recorded by an earlier one."""
+    poller.poll()
+
+    fresh = StatusPoller(poller.config)
+
+    assert fresh.get_last_poll().records_processed == 7
+
+
+def _add_closed_incident(poller, ended_at):
+    """Store a closed host incident that ended at ended_at."""
+    session = poller._get_session()
+    try:
+        session.add(
+            Incident(
+                incident_type="host",
+                host_name="retired01",
+                state="DOWN",
+                started_at=ended_at,
+                ended_at=ended_at,
+            )
+        )
+        session.commit()
+    finally:
+        session.close()
+
+
+def _count_incidents(poller, host_name):
+    """Count stored incidents for host_name."""
+    session = poller._get_session()
+    try:
+        return session.query(Incident).filter(Incident.host_name == host_name).count()
+    finally:
+        session.close()
+
+
+def test_poll_leaves_retention_cleanup_to_its_own_job(poller):
+    """Polling no longer deletes old incidents; the cleanup job does."""
+    _add_closed_incident(poller, datetime(2020, 1, 1, tzinfo=UTC))
+
+    poller.poll()
+    assert _count_incidents(poller, "retired01") == 1
+
+    poller._cleanup()
+    assert _count_incidents(poller, "retired01") == 0
+
+
+def test_start_schedules_daily_cleanup(poller, monkeypatch):
+    """Starting the poller runs cleanup once on the worker and schedules it daily."""
+    monkeypatch.setattr(poller, "_poll_wrapper", lambda: None)
+    _add_closed_incident(poller, datetime(2020, 1, 1, tzinfo=UTC))
+
+    poller.start()
+    try:
+        job = poller.scheduler.get_job("incident_cleanup")
+
+        assert job is not None
+        fields = {field.name: str(field) for field in job.trigger.fields}
+        assert fields["hour"] == str(CLEANUP_HOUR)
+
+        # The first cleanup is a one-off job on the worker, not run inline
+        deadline = time.monotonic() + 5
+        while _count_incidents(poller, "retired01") and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _count_incidents(poller, "retired01") == 0
+    finally:
+        poller.stop()
+
+
+def test_startup_cleanup_runs_on_the_worker_thread(poller, monkeypatch):
+    """start() hands the first cleanup to the scheduler instead of running it inline."""
+    monkeypatch.setattr(poller, "_poll_wrapper", lambda: None)
+    ran = threading.Event()
+    threads = []
+
+    def record_cleanup():
+        threads.append(threading.current_thread())
+        ran.set()
+
+    monkeypatch.setattr(poller, "_cleanup", record_cleanup)
+
+    poller.start()
+    try:
+        assert ran.wait(timeout=5)
+        assert threads[0] is not threading.current_thread()
+    finally:
+        poller.stop()
@@ -4,26 +4,21 @@ from datetime import UTC, datetime, timedelta
 from xml.etree import ElementTree
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
 
 from nagios_public_status_page.config import RSSConfig
-from nagios_public_status_page.models import Base, Incident
+from nagios_public_status_page.models import Incident
 from nagios_public_status_page.rss.feed_generator import IncidentFeedGenerator
 
 
 @pytest.fixture
-def test_db():
-    """Create a test database session."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    session_factory = sessionmaker(bind=engine)
-    session = session_factory()
-    yield session
-    session.close()
+def test_db(db_session):
+    """Create a test database session, rolled back after the test."""
+    return db_session
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def rss_config():
     """Create a test RSS configuration."""
     return RSSConfig(
@@ -34,16 +29,21 @@ def rss_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def feed_generator(rss_config):
     """Create a test feed generator."""
     return IncidentFeedGenerator(rss_config, base_url="https://status.test.com")
 
 
-@pytest.fixture
-def sample_incidents(test_db):
-    """Create sample incidents for testing."""
+@pytest.fixture(scope="module")
+def sample_incidents(db_engine):
+    """Create sample incidents once for the module.
+
+    Committed outside any test's transaction, so they survive each test's
+    rollback; no test modifies them.
+    """
     now = datetime.now(UTC)
+    session = Session(db_engine)
 
     # Active host incident
     host_incident = Incident(
@@ -56,7 +56,7 @@ def sample_incidents(test_db):
         last_check=now - timedelta(minutes=5),
         plugin_output="Host unreachable",
     )
-    test_db.add(host_incident)
+    session.add(host_incident)
 
     # Resolved service incident
     service_incident = Incident(
@@ -69,7 +69,7 @@ def sample_incidents(test_db):
         last_check=now - timedelta(hours=1),
         plugin_output="Connection refused",
     )
-    test_db.add(service_incident)
+    session.add(service_incident)
 
     # Active service incident for different host
     service_incident2 = Incident(
@@ -82,12 +82,25 @@ def sample_incidents(test_db):
         last_check=now - timedelta(minutes=5),
         plugin_output="Slow queries detected",
     )
-    test_db.add(service_incident2)
+    session.add(service_incident2)
 
-    test_db.commit()
+    session.commit()
+    session.close()
     return [host_incident, service_incident, service_incident2]
 
 
+def parse_channel(feed_xml):
+    """Parse feed XML and return its channel element."""
+    return ElementTree.fromstring(feed_xml).find("channel")
+
+
+@pytest.fixture(scope="module")
+def global_feed_channel(feed_generator, db_engine, sample_incidents):
+    """Generate and parse the 24-hour global feed once for the module."""
+    with Session(db_engine) as session:
+        return parse_channel(feed_generator.generate_global_feed(session, hours=24))
+
+
 def test_create_base_feed(feed_generator, rss_config):
     """Test base feed creation."""
     feed = feed_generator._create_base_feed("/feed/rss.xml")
@@ -97,15 +110,9 @@ def test_create_base_feed(feed_generator, rss_config):
     assert feed.language() == "en"
 
 
-def test_generate_global_feed(feed_generator, test_db, sample_incidents):
+def test_generate_global_feed(global_feed_channel):
     """Test global RSS feed generation."""
-    feed_xml = feed_generator.generate_global_feed(test_db, hours=24)
-
-    # Parse XML to verify structure
-    root = ElementTree.fromstring(feed_xml)
-
-    # Check channel exists
-    channel = root.find("channel")
+    channel = global_feed_channel
     assert channel is not None
 
     # Check title
@@ -123,8 +130,7 @@ def test_generate_global_feed_respects_hours(feed_generator, test_db, sample_inc
     # Only get incidents from last 3 hours (should exclude the 4-hour-old incident)
     feed_xml = feed_generator.generate_global_feed(test_db, hours=3)
 
-    root = ElementTree.fromstring(feed_xml)
-    channel = root.find("channel")
+    channel = parse_channel(feed_xml)
     items = channel.findall("item")
 
     # Should have 2 incidents (not the 4-hour-old one)
@@ -137,8 +143,7 @@ def test_generate_host_feed(feed_generator, test_db, sample_incidents):
 
     assert feed_xml is not None
 
-    root = ElementTree.fromstring(feed_xml)
-    channel = root.find("channel")
+    channel = parse_channel(feed_xml)
 
     # Check title includes host name
     title = channel.find("title")
@@ -164,8 +169,7 @@ def test_generate_service_feed(feed_generator, test_db, sample_incidents):
 
     assert feed_xml is not None
 
-    root = ElementTree.fromstring(feed_xml)
-    channel = root.find("channel")
+    channel = parse_channel(feed_xml)
 
     # Check title includes service name
     title = channel.find("title")
@@ -185,68 +189,45 @@ def test_generate_service_feed_no_incidents(feed_generator, test_db, sample_inci
     assert feed_xml is None
 
 
-def test_feed_entry_contains_required_fields(feed_generator, test_db, sample_incidents):
-    """Test that feed entries contain all required fields."""
-    feed_xml = feed_generator.generate_global_feed(test_db, hours=24)
-
-    root = ElementTree.fromstring(feed_xml)
-    channel = root.find("channel")
-    item = channel.find("item")
+def test_feed_entry_contains_required_fields(global_feed_channel):
+    """Test that every feed entry contains all required fields."""
+    items = global_feed_channel.findall("item")
+    assert items
 
     # Check required RSS fields
-    assert item.find("title") is not None
-    assert item.find("guid") is not None
-    assert item.find("link") is not None
-    assert item.find("pubDate") is not None
-    assert item.find("description") is not None
+    for item in items:
+        for field in ("title", "guid", "link", "pubDate", "description"):
+            assert item.find(field) is not None, field
 
 
-def test_feed_entry_active_incident(feed_generator, test_db, sample_incidents):
-    """Test feed entry for active incident."""
-    feed_xml = feed_generator.generate_global_feed(test_db, hours=24)
+@pytest.mark.parametrize("status", ["ACTIVE", "RESOLVED"])
+def test_feed_entry_status(global_feed_channel, status):
+    """Test the feed has entries for both active and resolved incidents."""
+    items = global_feed_channel.findall("item")
 
-    root = ElementTree.fromstring(feed_xml)
-    channel = root.find("channel")
-    items = channel.findall("item")
-
-    # Find an active incident (should say ACTIVE in description)
-    active_items = [
-        item for item in items if "ACTIVE" in item.find("description").text
-    ]
-    assert len(active_items) >= 1
-
-
-def test_feed_entry_resolved_incident(feed_generator, test_db, sample_incidents):
-    """Test feed entry for resolved incident."""
-    feed_xml = feed_generator.generate_global_feed(test_db, hours=24)
-
-    root = ElementTree.fromstring(feed_xml)
-    channel = root.find("channel")
-    items = channel.findall("item")
-
-    # Find resolved incidents (should say RESOLVED in description)
-    resolved_items = [
-        item for item in items if "RESOLVED" in item.find("description").text
-    ]
-    assert len(resolved_items) >= 1
+    assert any(status in item.find("description").text for item in items)
 
 
 def test_feed_respects_max_items(test_db, rss_config):
     """Test that feed respects max_items configuration."""
     # Create many incidents
     now = datetime.now(UTC)
-    for i in range(100):
-        incident = Incident(
-            incident_type="host",
-            host_name=f"host{i:03d}",
-            service_description=None,
-            state="DOWN",
-            started_at=now - timedelta(hours=i),
-            ended_at=None,
-            last_check=now,
-            plugin_output=f"Test incident {i}",
-        )
-        test_db.add(incident)
+    test_db.execute(
+        insert(Incident),
+        [
+            {
+                "incident_type": "host",
+                "host_name": f"host{i:03d}",
+                "service_description": None,
+                "state": "DOWN",
+                "started_at": now - timedelta(hours=i),
+                "ended_at": None,
+                "last_check": now,
+                "plugin_output": f"Test incident {i}",
+            }
+            for i in range(100)
+        ],
+    )
     test_db.commit()
 
     # Set max_items to 10
@@ -260,9 +241,25 @@ def test_feed_respects_max_items(test_db, rss_config):
 
     feed_xml = generator.generate_global_feed(test_db, hours=200)
 
-    root = ElementTree.fromstring(feed_xml)
-    channel = root.find("channel")
+    channel = parse_channel(feed_xml)
     items = channel.findall("item")
 
     # Should only have 10 items
     assert len(items) == 10
+
+
+def test_feed_reads_rows_without_loading_incidents(feed_generator, test_db, sample_incidents):
+    """Feeds are built from selected columns, not hydrated Incident objects."""
+    loaded = []
+
+    def listener(target, _context):
+        loaded.append(target)
+
+    event.listen(Incident, "load", listener)
+    try:
+        feed_xml = feed_generator.generate_host_feed(test_db, "webserver01", hours=24)
+    finally:
+        event.remove(Incident, "load", listener)
+
+    assert len(parse_channel(feed_xml).findall("item")) == 2
+    assert loaded == []
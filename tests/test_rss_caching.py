@@ -0,0 +1,138 @@
+"""Tests for RSS feed caching and conditional requests.
+
+Feed readers re-fetch feeds on a timer, far more often than incidents change.
+Rendered feeds are now cached against an aggregate "version" of the incidents
+in the feed window, tagged with an ETag derived from it, and a matching
+If-None-Match is answered with an empty 304.
+"""
+
+from datetime import UTC, datetime, timedelta
+from xml.etree import ElementTree
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.testclient import TestClient
+
+from nagios_public_status_page.api.routes import get_db
+from nagios_public_status_page.main import app
+from nagios_public_status_page.models import Base, Comment, Incident
+from nagios_public_status_page.rss.feed_generator import IncidentFeedGenerator
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """Session factory for a temporary database holding one active incident."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+
+    session = factory()
+    now = datetime.now(UTC)
+    session.add(
+        Incident(
+            incident_type="host",
+            host_name="webserver01",
+            state="DOWN",
+            started_at=now - timedelta(hours=1),
+            last_check=now - timedelta(minutes=5),
+            plugin_output="Host unreachable",
+        )
+    )
+    session.commit()
+    session.close()
+
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def client(session_factory):
+    """Test client reading the temporary database."""
+
+    def override_get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def render_calls(monkeypatch):
+    """Count calls to the global feed renderer."""
+    calls = []
+    original = IncidentFeedGenerator.generate_global_feed
+
+    def counting(self, session, hours=24):
+        calls.append(hours)
+        return original(self, session, hours=hours)
+
+    monkeypatch.setattr(IncidentFeedGenerator, "generate_global_feed", counting)
+    return calls
+
+
+@pytest.mark.parametrize("path", ["/feed/rss.xml", "/feed/host/webserver01/rss.xml"])
+def test_feed_carries_etag_and_answers_304(client, path):
+    """A feed advertises an ETag and Cache-Control, and revalidates to 304."""
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "public, max-age=60"
+    etag = response.headers["ETag"]
+
+    revalidated = client.get(path, headers={"If-None-Match": etag})
+
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+
+def test_unchanged_feed_is_rendered_once(client, render_calls):
+    """Repeated fetches of an unchanged feed reuse the rendered XML."""
+    first = client.get("/feed/rss.xml")
+    second = client.get("/feed/rss.xml")
+
+    assert first.text == second.text
+    assert len(render_calls) == 1
+
+
+def test_new_comment_invalidates_the_feed(client, session_factory, render_calls):
+    """The comment count is part of each entry, so a comment must show up."""
+    etag = client.get("/feed/rss.xml").headers["ETag"]
+
+    session = session_factory()
+    incident = session.query(Incident).one()
+    session.add(Comment(incident_id=incident.id, author="ops", comment_text="Looking"))
+    session.commit()
+    session.close()
+
+    response = client.get("/feed/rss.xml", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    description = ElementTree.fromstring(response.text).find("channel/item/description")
+    assert "Comments:</strong> 1" in description.text
+    assert len(render_calls) == 2
+
+
+def test_resolved_incident_invalidates_the_feed(client, session_factory):
+    """An incident ending changes its entry from ACTIVE to RESOLVED."""
+    assert "ACTIVE" in client.get("/feed/rss.xml").text
+
+    session = session_factory()
+    incident = session.query(Incident).one()
+    incident.ended_at = datetime.now(UTC)
+    session.commit()
+    session.close()
+
+    assert "RESOLVED" in client.get("/feed/rss.xml").text
+
+
+def test_host_without_incidents_is_still_404(client):
+    """Caching a missing feed must not turn it into an empty 200."""
+    assert client.get("/feed/host/nosuchhost/rss.xml").status_code == 404
+    assert client.get("/feed/host/nosuchhost/rss.xml").status_code == 404